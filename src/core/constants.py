@@ -16,6 +16,16 @@ SIG_ROW_I_FLEX = re.compile(b'\\x24\x8b\x0a\xb7\x71\x03\x02', re.DOTALL)
 SIG_BOOST_0RPM = b'\x24\x51\x5F\x5E\x83\x86\xAA'  # byte, 5 floats (throttle positions)
 SIG_BOOST_ROW  = b'\x24\x51\x5F\x5E\x83\x96\xAA'  # int32, 5 floats (throttle positions)
 
+# Signature lengths, folded once at import time (all row signatures are
+# 7 bytes; param signatures vary 5-7 and are measured via PARAMS)
+SIG_0RPM_LEN       = len(SIG_0RPM)
+SIG_0RPM_ALT_LEN   = len(SIG_0RPM_ALT)
+SIG_ROW_I_LEN      = len(SIG_ROW_I)
+SIG_ROW_F_LEN      = len(SIG_ROW_F)
+SIG_ENDVAR_LEN     = len(SIG_ENDVAR)
+SIG_BOOST_0RPM_LEN = len(SIG_BOOST_0RPM)
+SIG_BOOST_ROW_LEN  = len(SIG_BOOST_ROW)
+
 # Torque table structures
 ROW0_STRUCT     = struct.Struct('<Bff')
 ROW0_ALT_STRUCT = struct.Struct('<BBf')
@@ -98,6 +108,16 @@ PARAMS = {
     b'\x28\xCA\x2F\xD1\x34': ('BoostSetting_NoValue', ()),  # No value variant
 }
 
+# Reverse lookups over PARAMS so per-call linear scans are avoided.
+# Some names appear under several signatures (e.g. IdleRPMLogic, RevLimitRange);
+# the (name, fmt) map disambiguates those, and the name-only map keeps the
+# first occurrence to match the old scan order.
+PARAM_SIG_BY_NAME_FMT = {(name, fmt): sig for sig, (name, fmt) in PARAMS.items()}
+PARAM_SIG_FMT_BY_NAME = {}
+for _sig, (_name, _fmt) in PARAMS.items():
+    PARAM_SIG_FMT_BY_NAME.setdefault(_name, (_sig, _fmt))
+del _sig, _name, _fmt
+
 ENGINE_LAYOUT_CODES = {
     b'\xD7\x50\x75\x68\xA3\x0A\x62': 'Single Cylinder (8B sequence)',
     b'\xC2\x2D\x3B': 'Flat 4 / 3 Rotor (per SMS)',
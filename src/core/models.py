@@ -1,13 +1,31 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Tuple, Optional, List, Union
 from .constants import (
     SIG_0RPM, SIG_0RPM_ALT, SIG_ROW_I, SIG_ROW_F, SIG_ENDVAR,
     SIG_BOOST_0RPM, SIG_BOOST_ROW,
     ROW0_STRUCT, ROW0_ALT_STRUCT, ROWI_STRUCT, ROWF_STRUCT, ENDVAR_STRUCT,
-    BOOST0_STRUCT, BOOSTI_STRUCT, PARAMS
+    BOOST0_STRUCT, BOOSTI_STRUCT,
+    PARAM_SIG_BY_NAME_FMT, PARAM_SIG_FMT_BY_NAME
 )
 
-@dataclass
+# Per-kind record sizes, precomputed once so row.size is a single dict hit
+# instead of a chain of string compares. The kind strings themselves stay:
+# they are part of the parse/CSV/display contract.
+_TORQUE_ROW_SIZE = {
+    '0rpm':     len(SIG_0RPM) + ROW0_STRUCT.size,
+    '0rpm_alt': len(SIG_0RPM_ALT) + ROW0_ALT_STRUCT.size,
+    'row_i':    len(SIG_ROW_I) + ROWI_STRUCT.size,
+    'row_f':    len(SIG_ROW_F) + ROWF_STRUCT.size,
+    'endvar':   len(SIG_ENDVAR) + ENDVAR_STRUCT.size,
+}
+
+_BOOST_ROW_SIZE = {
+    'boost_0rpm': len(SIG_BOOST_0RPM) + BOOST0_STRUCT.size,
+    'boost_row':  len(SIG_BOOST_ROW) + BOOSTI_STRUCT.size,
+}
+
+
+@dataclass(slots=True)
 class TorqueRow:
     rpm: float
     compression: float
@@ -18,25 +36,26 @@ class TorqueRow:
 
     @property
     def size(self) -> int:
-        if self.kind == '0rpm': return len(SIG_0RPM) + ROW0_STRUCT.size
-        if self.kind == '0rpm_alt': return len(SIG_0RPM_ALT) + ROW0_ALT_STRUCT.size
-        if self.kind == 'row_i': 
-            sig_len = len(self.exact_signature) if self.exact_signature else len(SIG_ROW_I)
-            return sig_len + ROWI_STRUCT.size
-        if self.kind == 'row_f': return len(SIG_ROW_F) + ROWF_STRUCT.size
-        if self.kind == 'endvar': return len(SIG_ENDVAR) + ENDVAR_STRUCT.size
-        return 0
+        # Anomalous row_i rows carry their own (longer) signature
+        if self.exact_signature and self.kind == 'row_i':
+            return len(self.exact_signature) + ROWI_STRUCT.size
+        return _TORQUE_ROW_SIZE.get(self.kind, 0)
 
-@dataclass
+@dataclass(slots=True)
 class TorqueTable:
     offset: int
     rows: List[TorqueRow]
-    
+    # Row kinds/signatures are fixed post-parse, so the summed size never
+    # changes and is computed at most once.
+    _cached_size: Optional[int] = field(default=None, init=False, repr=False, compare=False)
+
     @property
     def size(self) -> int:
-        return sum(r.size for r in self.rows)
+        if self._cached_size is None:
+            self._cached_size = sum(r.size for r in self.rows)
+        return self._cached_size
 
-@dataclass
+@dataclass(slots=True)
 class BoostRow:
     rpm: float
     t0: float
@@ -49,47 +68,48 @@ class BoostRow:
     
     @property
     def size(self) -> int:
-        if self.kind == 'boost_0rpm': return len(SIG_BOOST_0RPM) + BOOST0_STRUCT.size
-        if self.kind == 'boost_row': return len(SIG_BOOST_ROW) + BOOSTI_STRUCT.size
-        return 0
+        return _BOOST_ROW_SIZE.get(self.kind, 0)
 
-@dataclass
+@dataclass(slots=True)
 class BoostTable:
     offset: int
     rows: List[BoostRow]
-    
+    _cached_size: Optional[int] = field(default=None, init=False, repr=False, compare=False)
+
     @property
     def size(self) -> int:
-        return sum(r.size for r in self.rows)
+        if self._cached_size is None:
+            self._cached_size = sum(r.size for r in self.rows)
+        return self._cached_size
 
-@dataclass
+@dataclass(slots=True)
 class Parameter:
     name: str
     offset: int
     values: Tuple[Union[float, int], ...]
     fmt: Optional[Tuple[str, ...]] = None
-    
+    # name and fmt are fixed post-parse (edits only touch values), so the
+    # size is computed at most once; read on every tree selection/highlight.
+    _cached_size: Optional[int] = field(default=None, init=False, repr=False, compare=False)
+
     @property
     def size(self) -> int:
-        # Need to find signature length
-        # This is slightly inefficient but safe
-        sig_len = 0
+        if self._cached_size is not None:
+            return self._cached_size
         fmt_seq = self.fmt
-        
-        for sig, (pname, pfmt) in PARAMS.items():
-            if pname == self.name:
-                sig_len = len(sig)
-                if not fmt_seq: fmt_seq = pfmt
-                break
-        
+        if fmt_seq and (self.name, fmt_seq) in PARAM_SIG_BY_NAME_FMT:
+            sig = PARAM_SIG_BY_NAME_FMT[(self.name, fmt_seq)]
+        else:
+            sig, default_fmt = PARAM_SIG_FMT_BY_NAME.get(self.name, (b'', ()))
+            if not fmt_seq:
+                fmt_seq = default_fmt
+
         data_size = 0
         if fmt_seq:
-            for f in fmt_seq:
-                if f == 'f': data_size += 4
-                elif f == 'i': data_size += 4
-                elif f == 'b': data_size += 1
-        
-        return sig_len + data_size
+            data_size = sum(1 if f == 'b' else 4 for f in fmt_seq)
+
+        self._cached_size = len(sig) + data_size
+        return self._cached_size
 
 
 @dataclass
@@ -1,6 +1,15 @@
+import re
 import struct
+from functools import lru_cache
 from typing import List, Tuple, Optional, Generator, Union
 
+# NumPy is optional (like matplotlib): when present, long runs of torque rows
+# are decoded in bulk at C level; without it the scalar loop below is used.
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 from .constants import (
     SIG_0RPM, SIG_0RPM_ALT, SIG_ROW_I, SIG_ROW_F, SIG_ENDVAR,
     SIG_BOOST_0RPM, SIG_BOOST_ROW,
@@ -10,17 +19,34 @@ from .constants import (
 )
 from .models import TorqueRow, TorqueTable, BoostRow, BoostTable, Parameter
 
-def find_all(data: bytes, sub: bytes) -> Generator[int, None, None]:
-    start = 0
+# Parsing never copies or rebuilds the buffer: the app keeps one persistent
+# bytearray that the write_* helpers mutate in place and save_file writes out
+# directly. Any object with find/startswith/unpack_from support works here.
+Buffer = Union[bytes, bytearray]
+
+# Plausibility bounds, defined once and consumed by the plausible_* helpers,
+# the scalar row loops, and the vectorized run decoders alike — so the NumPy
+# and fallback parse paths can never drift apart.
+_RPM_MIN, _RPM_MAX = 0, 25000
+_COMP_MIN, _COMP_MAX = -500.0, 250.0   # some older V8 engines have deep negative scaling
+_TORQUE_MIN, _TORQUE_MAX = -4000, 10000
+_BOOST_MIN, _BOOST_MAX = 0.5, 3.0      # throttle boost, typically 0.5-2.0 bar
+
+def find_all(data: Buffer, sub: bytes, start: int = 0, end: Optional[int] = None) -> Generator[int, None, None]:
+    # bytes.find is already a single C call per hit with no allocation, so
+    # this stays a find loop; start/end let callers restrict the search to a
+    # window instead of slicing (which would copy).
+    if end is None:
+        end = len(data)
     L = len(sub)
     while True:
-        i = data.find(sub, start)
+        i = data.find(sub, start, end)
         if i == -1:
             return
         yield i
         start = i + L  # step to next occurrence (avoid overlap)
 
-def read_by_fmt(data: bytes, pos: int, fmtseq: Tuple[str, ...]) -> Tuple[Optional[List[Union[float, int]]], int]:
+def read_by_fmt(data: Buffer, pos: int, fmtseq: Tuple[str, ...]) -> Tuple[Optional[List[Union[float, int]]], int]:
     vals = []
     cur = pos
     for f in fmtseq:
@@ -40,39 +66,166 @@ def read_by_fmt(data: bytes, pos: int, fmtseq: Tuple[str, ...]) -> Tuple[Optiona
             return None, pos
     return vals, cur
 
+if np is not None:
+    # One full row_i record: 7-byte signature + <iff payload (19 bytes, packed)
+    _ROWI_RECORD = np.dtype([('sig', 'V7'), ('rpm', '<i4'), ('comp', '<f4'), ('tq', '<f4')])
+    # One full row_f record: 7-byte signature + <fff payload (19 bytes, packed)
+    _ROWF_RECORD = np.dtype([('sig', 'V7'), ('rpm', '<f4'), ('comp', '<f4'), ('tq', '<f4')])
+    # One full boost row record: 7-byte signature + <ifffff payload (31 bytes, packed)
+    _BOOSTI_RECORD = np.dtype([('sig', 'V7'), ('rpm', '<i4'),
+                               ('t0', '<f4'), ('t25', '<f4'), ('t50', '<f4'),
+                               ('t75', '<f4'), ('t100', '<f4')])
+    # Signature scalars for whole-signature vectorized comparison: one C-level
+    # memcmp per candidate record instead of a Python-level prefix check each
+    _ROWI_SIG_V = np.frombuffer(SIG_ROW_I, dtype='V7')[0]
+    _ROWF_SIG_V = np.frombuffer(SIG_ROW_F, dtype='V7')[0]
+    _BOOSTI_SIG_V = np.frombuffer(SIG_BOOST_ROW, dtype='V7')[0]
+
+
+def _decode_torque_run(data: Buffer, q: int, sig_v, rec_dtype, stride: int,
+                       kind: str) -> Tuple[List['TorqueRow'], int, bool]:
+    """Bulk-decode a run of consecutive row_i/row_f records starting at q.
+
+    Counts how many full records with an exact signature prefix sit back to
+    back, decodes them in one `np.frombuffer` call, and validates rpm/comp/tq
+    with vectorized masks against the shared plausibility bounds. Returns
+    (rows, next_q, clean); clean is False when a matched record failed a
+    plausibility check or was truncated, in which case the caller must end
+    the table (same early-break semantics as the scalar loop).
+    """
+    limit = (len(data) - q) // stride
+    if limit == 0:
+        # Signature matched at q but the record is truncated
+        return [], q, False
+
+    recs = np.frombuffer(data, dtype=rec_dtype, count=limit, offset=q)
+    sig_ok = recs['sig'] == sig_v
+    count = limit if sig_ok.all() else int(np.argmin(sig_ok))
+    if count == 0:
+        return [], q, False
+    recs = recs[:count]
+    rpm = recs['rpm'].astype(np.float64)
+    comp = recs['comp'].astype(np.float64)
+    tq = recs['tq'].astype(np.float64)
+    ok = ((rpm >= _RPM_MIN) & (rpm <= _RPM_MAX)
+          & (comp >= _COMP_MIN) & (comp <= _COMP_MAX)
+          & (tq >= _TORQUE_MIN) & (tq <= _TORQUE_MAX))
+    valid = count if ok.all() else int(np.argmin(ok))
+
+    rows = [TorqueRow(float(rpm[k]), float(comp[k]), float(tq[k]), q + k * stride, kind)
+            for k in range(valid)]
+    return rows, q + valid * stride, valid == count
+
+
+def _decode_rowi_run(data: Buffer, q: int) -> Tuple[List['TorqueRow'], int, bool]:
+    return _decode_torque_run(data, q, _ROWI_SIG_V, _ROWI_RECORD,
+                              len(SIG_ROW_I) + ROWI_STRUCT.size, 'row_i')
+
+
+def _decode_rowf_run(data: Buffer, q: int) -> Tuple[List['TorqueRow'], int, bool]:
+    return _decode_torque_run(data, q, _ROWF_SIG_V, _ROWF_RECORD,
+                              len(SIG_ROW_F) + ROWF_STRUCT.size, 'row_f')
+
+
+def _decode_boost_run(data: Buffer, q: int) -> Tuple[List['BoostRow'], int, bool]:
+    """Bulk-decode a run of consecutive boost_row records starting at q.
+
+    Same contract as _decode_rowi_run: returns (rows, next_q, clean), with
+    clean False when a matched record failed a sanity check or was truncated.
+    """
+    stride = len(SIG_BOOST_ROW) + BOOSTI_STRUCT.size
+    limit = (len(data) - q) // stride
+    if limit == 0:
+        return [], q, False
+
+    recs = np.frombuffer(data, dtype=_BOOSTI_RECORD, count=limit, offset=q)
+    sig_ok = recs['sig'] == _BOOSTI_SIG_V
+    count = limit if sig_ok.all() else int(np.argmin(sig_ok))
+    if count == 0:
+        return [], q, False
+    recs = recs[:count]
+    rpm = recs['rpm'].astype(np.float64)
+    throttle = [recs[f].astype(np.float64) for f in ('t0', 't25', 't50', 't75', 't100')]
+    ok = (rpm >= _RPM_MIN) & (rpm <= _RPM_MAX)
+    for col in throttle:
+        ok &= (col >= _BOOST_MIN) & (col <= _BOOST_MAX)
+    valid = count if ok.all() else int(np.argmin(ok))
+
+    t0, t25, t50, t75, t100 = throttle
+    rows = [BoostRow(int(rpm[k]), float(t0[k]), float(t25[k]), float(t50[k]),
+                     float(t75[k]), float(t100[k]), q + k * stride, 'boost_row')
+            for k in range(valid)]
+    return rows, q + valid * stride, valid == count
+
+
 def plausible_rpm(x: float) -> bool:
-    return 0 <= x <= 25000
+    return _RPM_MIN <= x <= _RPM_MAX
 
 def plausible_comp(val):
-    return -500.0 <= val <= 250.0  # Some older V8 engines have deep negative scaling
+    return _COMP_MIN <= val <= _COMP_MAX
 
 def plausible_torque(x: float) -> bool:
-    return -4000 <= x <= 10000
+    return _TORQUE_MIN <= x <= _TORQUE_MAX
+
+# All four torque signatures are scanned in one regex-engine pass: the
+# alternation is compiled once and finditer yields (offset, signature) pairs
+# directly, so the hot dispatch never runs in the interpreter.
+_TORQUE_SIG_RE = re.compile(
+    b'|'.join(re.escape(s) for s in (SIG_0RPM, SIG_0RPM_ALT, SIG_ROW_I, SIG_ROW_F))
+)
+_TORQUE_KIND_BY_SIG = {
+    SIG_0RPM:     '0rpm',
+    SIG_0RPM_ALT: '0rpm_alt',
+    SIG_ROW_I:    'row_i_native',
+    SIG_ROW_F:    'row_f_native',
+}
 
-def parse_torque_tables(data: bytes) -> List[TorqueTable]:
+# Inside a table the row ladder is gated by the 5-byte prefix all five row
+# signatures share; the 2-byte tail then picks the kind with one dict hit
+# instead of up to five slice compares per position.
+_TORQUE_SIG_PREFIX = SIG_0RPM[:5]
+_ROW_KIND_BY_TAIL = {
+    SIG_0RPM[5:]:     '0rpm',
+    SIG_0RPM_ALT[5:]: '0rpm_alt',
+    SIG_ROW_I[5:]:    'row_i',
+    SIG_ROW_F[5:]:    'row_f',
+    SIG_ENDVAR[5:]:   'endvar',
+}
+
+def parse_torque_tables(data: Buffer) -> List[TorqueTable]:
     from .constants import SIG_ROW_I_FLEX
     tables = []
-    
-    # We must scan for standard headers, alt headers, and explicit row_i orphans
-    starts_0rpm = [(pos, '0rpm', None) for pos in find_all(data, SIG_0RPM)]
-    starts_0rpm_alt = [(pos, '0rpm_alt', None) for pos in find_all(data, SIG_0RPM_ALT)]
-    starts_row_i = [(pos, 'row_i_native', None) for pos in find_all(data, SIG_ROW_I)]
-    starts_row_f = [(pos, 'row_f_native', None) for pos in find_all(data, SIG_ROW_F)]
-    
-    starts_flex = []
-    for match in SIG_ROW_I_FLEX.finditer(data):
-        idx = match.start()
-        if idx >= 4:
-            rpm_bytes = data[idx-4:idx]
-            try:
-                rpm, = struct.unpack('<I', rpm_bytes)
-                if 0 < rpm <= 25000:
-                    starts_flex.append((idx - 4, 'row_i_flex', match.group(0)))
-            except struct.error:
-                pass
-
-    all_starts = starts_0rpm + starts_0rpm_alt + starts_row_i + starts_row_f + starts_flex
-    all_starts.sort(key=lambda x: x[0])
+
+    # We must scan for standard headers, alt headers, and explicit row_i
+    # orphans. One regex pass finds and classifies them all; finditer yields
+    # matches in offset order so no sort is needed (a flex entry at pos-4
+    # still precedes its own alt entry and follows every earlier match).
+    all_starts = []
+    for m in _TORQUE_SIG_RE.finditer(data):
+        pos = m.start()
+        sig = m.group(0)
+        kind = _TORQUE_KIND_BY_SIG[sig]
+        if kind == '0rpm_alt':
+            # The alt-0rpm signature doubles as the flex row_i signature when
+            # a plausible explicit RPM immediately precedes it (forc.edfbin)
+            if pos >= 4:
+                rpm, = struct.unpack_from('<I', data, pos - 4)
+                if 0 < rpm <= _RPM_MAX:
+                    all_starts.append((pos - 4, 'row_i_flex', sig))
+            all_starts.append((pos, '0rpm_alt', None))
+        else:
+            all_starts.append((pos, kind, None))
+
+    # Hot-loop locals: bound methods and lengths resolved once instead of
+    # per iteration (attribute lookups are dict hits in CPython).
+    n = len(data)
+    startswith = data.startswith
+    rowi_unpack = ROWI_STRUCT.unpack_from
+    rowf_unpack = ROWF_STRUCT.unpack_from
+    endvar_unpack = ENDVAR_STRUCT.unpack_from
+    sig_i_len = len(SIG_ROW_I)
+    sig_f_len = len(SIG_ROW_F)
+    sig_e_len = len(SIG_ENDVAR)
 
     last_parsed_byte = 0
     
@@ -85,14 +238,14 @@ def parse_torque_tables(data: bytes) -> List[TorqueTable]:
         
         if kind == '0rpm_alt':
             p = off0 + len(SIG_0RPM_ALT)
-            if p + ROW0_ALT_STRUCT.size > len(data): continue
+            if p + ROW0_ALT_STRUCT.size > n: continue
             b0, b1, comp0 = ROW0_ALT_STRUCT.unpack_from(data, p)
             if not plausible_comp(comp0): continue
             rows.append(TorqueRow(0.0, comp0, None, off0, '0rpm_alt'))
             q = p + ROW0_ALT_STRUCT.size
         elif kind == '0rpm':
             p = off0 + len(SIG_0RPM)
-            if p + ROW0_STRUCT.size > len(data): continue
+            if p + ROW0_STRUCT.size > n: continue
             b0, comp0, tq0 = ROW0_STRUCT.unpack_from(data, p)
             if not (plausible_comp(comp0) and plausible_torque(tq0)): continue
             rows.append(TorqueRow(0.0, comp0, tq0, off0, '0rpm'))
@@ -100,7 +253,7 @@ def parse_torque_tables(data: bytes) -> List[TorqueTable]:
         elif kind == 'row_i_flex':
             p = off0 + 4 + len(exact_sig)
             # Accommodate the 1-byte b0 variant padding (like standard 0RPM rows have)
-            if p + 9 > len(data): continue
+            if p + 9 > n: continue
             b0, comp, tq = struct.unpack_from('<Bff', data, p)
             rpm_val = struct.unpack_from('<I', data, off0)[0]
             if not (plausible_comp(comp) and plausible_torque(tq)): continue
@@ -112,7 +265,7 @@ def parse_torque_tables(data: bytes) -> List[TorqueTable]:
             # Missing 0RPM header completely, starting organically on an intermediate row struct
             sig_off = off0
             p = off0 + len(SIG_ROW_I)
-            if p + ROWI_STRUCT.size > len(data): continue
+            if p + ROWI_STRUCT.size > n: continue
             rpm_i, comp, tq = ROWI_STRUCT.unpack_from(data, p)
             rpm = float(rpm_i)
             if not (plausible_rpm(rpm) and plausible_comp(comp) and plausible_torque(tq)): continue
@@ -122,48 +275,64 @@ def parse_torque_tables(data: bytes) -> List[TorqueTable]:
             # Missing 0RPM header completely, starting organically on an end row struct (like fer312)
             sig_off = off0
             p = off0 + len(SIG_ROW_F)
-            if p + ROWF_STRUCT.size > len(data): continue
+            if p + ROWF_STRUCT.size > n: continue
             rpm_i, comp, tq = ROWF_STRUCT.unpack_from(data, p)
             rpm = float(rpm_i)
             if not (plausible_rpm(rpm) and plausible_comp(comp) and plausible_torque(tq)): continue
             rows.append(TorqueRow(rpm, comp, tq, sig_off, 'row_f'))
             q = p + ROWF_STRUCT.size
         
-        while q < len(data):
-            if data[q:q+len(SIG_0RPM)] == SIG_0RPM or data[q:q+len(SIG_0RPM_ALT)] == SIG_0RPM_ALT:
+        while q < n:
+            # Prefix gate + tail dispatch (see _ROW_KIND_BY_TAIL above)
+            if startswith(_TORQUE_SIG_PREFIX, q):
+                row_kind = _ROW_KIND_BY_TAIL.get(bytes(data[q+5:q+7]))
+            else:
+                row_kind = None
+
+            if row_kind == '0rpm' or row_kind == '0rpm_alt':
                 break
-                
+
             # Internal rows might also use flex signatures in anomalous engines!
             # So we check if a flex signature naturally resides exactly here.
-            flex_match = SIG_ROW_I_FLEX.match(data, pos=q+4) if (q+4) < len(data) else None
-            
+            flex_match = SIG_ROW_I_FLEX.match(data, pos=q+4) if (q+4) < n else None
+
             # Legacy robust parsing loop:
-            if data[q:q+len(SIG_ROW_I)] == SIG_ROW_I or flex_match:
+            if row_kind == 'row_i' or flex_match:
                 sig_off = q
                 
                 if flex_match:
                     # Anomalous engine: RPM is implicitly first BEFORE the flex match
-                    if q + 4 > len(data): break
+                    if q + 4 > n: break
                     fuzz_sig = flex_match.group(0)
                     rpm_i = struct.unpack_from('<I', data, sig_off)[0]
                     
                     q += 4 + len(fuzz_sig)
-                    if q + 9 > len(data): break
+                    if q + 9 > n: break
                     b0, comp, tq = struct.unpack_from('<Bff', data, q)
                     jump_bytes = 9
                     fuzz_sig_full = fuzz_sig + bytes([b0])
+                elif np is not None:
+                    # Standard engine, NumPy available: decode the whole run of
+                    # consecutive row_i records in one bulk pass.
+                    run_rows, q, clean = _decode_rowi_run(data, q)
+                    rows.extend(run_rows)
+                    if not clean:
+                        break
+                    continue
                 else:
                     # Standard engine: Signature is first BEFORE the RPM and payload
                     fuzz_sig_full = None
-                    q += len(SIG_ROW_I)
-                    
-                    if q + ROWI_STRUCT.size > len(data): break
-                    rpm_i, comp, tq = ROWI_STRUCT.unpack_from(data, q)
+                    q += sig_i_len
+
+                    if q + ROWI_STRUCT.size > n: break
+                    rpm_i, comp, tq = rowi_unpack(data, q)
                     jump_bytes = ROWI_STRUCT.size
-                    
+
                 rpm = float(rpm_i)
-                if not (plausible_rpm(rpm) and plausible_comp(comp) and plausible_torque(tq)): break
-                
+                # plausible_* inlined: three calls per row add up in this loop
+                if not (_RPM_MIN <= rpm <= _RPM_MAX and _COMP_MIN <= comp <= _COMP_MAX
+                        and _TORQUE_MIN <= tq <= _TORQUE_MAX): break
+
                 row = TorqueRow(rpm, comp, tq, sig_off, 'row_i')
                 if fuzz_sig_full:
                     row.exact_signature = fuzz_sig_full
@@ -172,21 +341,29 @@ def parse_torque_tables(data: bytes) -> List[TorqueTable]:
                 q += jump_bytes
                 continue
                 
-            if data[q:q+len(SIG_ROW_F)] == SIG_ROW_F:
+            if row_kind == 'row_f':
+                if np is not None:
+                    run_rows, q, clean = _decode_rowf_run(data, q)
+                    rows.extend(run_rows)
+                    if not clean:
+                        break
+                    continue
+
                 sig_off = q
-                q += len(SIG_ROW_F)
-                if q + ROWF_STRUCT.size > len(data): break
-                rpm, comp, tq = ROWF_STRUCT.unpack_from(data, q)
-                if not (plausible_rpm(rpm) and plausible_comp(comp) and plausible_torque(tq)): break
+                q += sig_f_len
+                if q + ROWF_STRUCT.size > n: break
+                rpm, comp, tq = rowf_unpack(data, q)
+                if not (_RPM_MIN <= rpm <= _RPM_MAX and _COMP_MIN <= comp <= _COMP_MAX
+                        and _TORQUE_MIN <= tq <= _TORQUE_MAX): break
                 rows.append(TorqueRow(rpm, comp, tq, sig_off, 'row_f'))
                 q += ROWF_STRUCT.size
                 continue
                 
-            if data[q:q+len(SIG_ENDVAR)] == SIG_ENDVAR:
+            if row_kind == 'endvar':
                 sig_off = q
-                q += len(SIG_ENDVAR)
-                if q + ENDVAR_STRUCT.size > len(data): break
-                rpm_i, comp, b = ENDVAR_STRUCT.unpack_from(data, q)
+                q += sig_e_len
+                if q + ENDVAR_STRUCT.size > n: break
+                rpm_i, comp, b = endvar_unpack(data, q)
                 rows.append(TorqueRow(float(rpm_i), comp, None, sig_off, 'endvar'))
                 q += ENDVAR_STRUCT.size
                 break
@@ -202,42 +379,53 @@ def parse_torque_tables(data: bytes) -> List[TorqueTable]:
             
     return tables
 
-def parse_boost_tables(data: bytes) -> List[BoostTable]:
+def parse_boost_tables(data: Buffer) -> List[BoostTable]:
     """Parse turbo boost control lookup tables."""
     tables = []
+    n = len(data)
+    startswith = data.startswith
+    boosti_unpack = BOOSTI_STRUCT.unpack_from
+    sig_b_len = len(SIG_BOOST_ROW)
     for off0 in find_all(data, SIG_BOOST_0RPM):
         rows = []
         p = off0 + len(SIG_BOOST_0RPM)
-        if p + BOOST0_STRUCT.size > len(data): 
+        if p + BOOST0_STRUCT.size > n: 
             continue
         
         # Parse 0rpm row: byte (should be 0) + 5 floats for throttle positions
         b0, t0, t25, t50, t75, t100 = BOOST0_STRUCT.unpack_from(data, p)
         
         # Sanity check: throttle values should be between 0.5 and 3.0 typically (0.5-2.0 bar boost)
-        if not all(0.5 <= v <= 3.0 for v in [t0, t25, t50, t75, t100]):
+        if not all(_BOOST_MIN <= v <= _BOOST_MAX for v in [t0, t25, t50, t75, t100]):
             continue
             
         rows.append(BoostRow(0, t0, t25, t50, t75, t100, off0, 'boost_0rpm'))
         q = p + BOOST0_STRUCT.size
         
-        while q < len(data):
+        while q < n:
             # Check if we hit another boost table or end of data
-            if data[q:q+len(SIG_BOOST_0RPM)] == SIG_BOOST_0RPM:
+            if startswith(SIG_BOOST_0RPM, q):
                 break
             
-            if data[q:q+len(SIG_BOOST_ROW)] == SIG_BOOST_ROW:
+            if startswith(SIG_BOOST_ROW, q):
+                if np is not None:
+                    run_rows, q, clean = _decode_boost_run(data, q)
+                    rows.extend(run_rows)
+                    if not clean:
+                        break
+                    continue
+
                 sig_off = q
-                q += len(SIG_BOOST_ROW)
-                if q + BOOSTI_STRUCT.size > len(data): 
+                q += sig_b_len
+                if q + BOOSTI_STRUCT.size > n: 
                     break
                 
-                rpm, t0, t25, t50, t75, t100 = BOOSTI_STRUCT.unpack_from(data, q)
+                rpm, t0, t25, t50, t75, t100 = boosti_unpack(data, q)
                 
                 # Sanity checks
-                if not (0 <= rpm <= 25000):
+                if not (_RPM_MIN <= rpm <= _RPM_MAX):
                     break
-                if not all(0.5 <= v <= 3.0 for v in [t0, t25, t50, t75, t100]):
+                if not all(_BOOST_MIN <= v <= _BOOST_MAX for v in [t0, t25, t50, t75, t100]):
                     break
                 
                 rows.append(BoostRow(rpm, t0, t25, t50, t75, t100, sig_off, 'boost_row'))
@@ -253,27 +441,58 @@ def parse_boost_tables(data: bytes) -> List[BoostTable]:
     
     return tables
 
-def parse_params(data: bytes) -> List[Parameter]:
+# All ~50 parameter signatures in one pass: a zero-width lookahead so hits
+# may overlap, with alternatives longest-first so the capture is the longest
+# signature matching at each position (one sig is a proper prefix of another).
+_PARAM_SIG_RE = re.compile(
+    b'(?=(' + b'|'.join(re.escape(s) for s in sorted(PARAMS, key=len, reverse=True)) + b'))'
+)
+_MIN_PARAM_SIG_LEN = min(map(len, PARAMS))
+
+def parse_params(data: Buffer) -> List[Parameter]:
+    # Returned in offset order: finditer walks the buffer front to back, so
+    # consumers (the tree view sorts no longer needed) can rely on it.
     out = []
-    for sig, (name, fmt) in PARAMS.items():
-        for pos in find_all(data, sig):
-            start = pos + len(sig)
-            if len(fmt) == 0:
-                # No value variant (e.g., RevLimitSetting_NoValue)
-                out.append(Parameter(name, pos, (), fmt))
-            else:
-                vals, endp = read_by_fmt(data, start, fmt)
-                if vals is None:
-                    continue
-                out.append(Parameter(name, pos, tuple(vals), fmt))
+    for m in _PARAM_SIG_RE.finditer(data):
+        pos = m.start()
+        sig = m.group(1)
+        # A shorter signature can only co-match here as a prefix of the
+        # captured one, so walk the prefixes down to the minimum length.
+        while len(sig) >= _MIN_PARAM_SIG_LEN:
+            entry = PARAMS.get(sig)
+            if entry is not None:
+                name, fmt = entry
+                if len(fmt) == 0:
+                    # No value variant (e.g., RevLimitSetting_NoValue)
+                    out.append(Parameter(name, pos, (), fmt))
+                else:
+                    vals, endp = read_by_fmt(data, pos + len(sig), fmt)
+                    if vals is not None:
+                        out.append(Parameter(name, pos, tuple(vals), fmt))
+            sig = sig[:-1]
     return out
 
-def detect_engine_layout(data: bytes) -> Tuple[str, Optional[int]]:
-    # search from the end for known tag sequences (3B-terminated families)
-    tail = data[-64:] if len(data) > 64 else data
-    for k, label in ENGINE_LAYOUT_CODES.items():
-        i = tail.rfind(k)
-        if i != -1:
-            # compute absolute offset
-            return label, len(data) - len(tail) + i
+# First-byte index over ENGINE_LAYOUT_CODES so the tail is walked once
+# instead of once per pattern; extensible without O(tail) cost per new code.
+_LAYOUT_BY_FIRST_BYTE = {}
+for _pat, _label in ENGINE_LAYOUT_CODES.items():
+    _LAYOUT_BY_FIRST_BYTE.setdefault(_pat[0], []).append((_pat, _label))
+del _pat, _label
+
+@lru_cache(maxsize=8)
+def _scan_layout_tail(tail: bytes) -> Tuple[str, Optional[int]]:
+    """Reverse-scan a (hashable) tail for layout codes; cached since the tail
+    is unchanged across repeated UI refreshes of the same file."""
+    for i in range(len(tail) - 1, -1, -1):
+        for pat, label in _LAYOUT_BY_FIRST_BYTE.get(tail[i], ()):
+            if tail.startswith(pat, i):
+                return label, i
     return 'Unknown/Not found', None
+
+def detect_engine_layout(data: Buffer) -> Tuple[str, Optional[int]]:
+    # search from the end for known tag sequences (3B-terminated families)
+    tail = bytes(data[-64:]) if len(data) > 64 else bytes(data)
+    label, i = _scan_layout_tail(tail)
+    if i is None:
+        return label, None
+    return label, len(data) - len(tail) + i
@@ -1,15 +1,29 @@
 import struct
+from functools import lru_cache
 from typing import List, Tuple, cast
 
+# Optional, matching the parser: with NumPy the bulk torque scale becomes one
+# vectorized multiply plus one fancy-indexed write into the bytearray.
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 from .models import TorqueRow, TorqueTable, BoostRow, BoostTable, Parameter
 from .constants import (
-    SIG_0RPM, SIG_0RPM_ALT, SIG_ROW_I, SIG_ROW_F, SIG_ENDVAR,
-    SIG_BOOST_0RPM, SIG_BOOST_ROW,
+    SIG_0RPM_LEN, SIG_0RPM_ALT_LEN, SIG_ROW_I_LEN, SIG_ROW_F_LEN, SIG_ENDVAR_LEN,
+    SIG_BOOST_0RPM_LEN, SIG_BOOST_ROW_LEN,
     ROW0_STRUCT, ROW0_ALT_STRUCT, ROWI_STRUCT, ROWF_STRUCT, ENDVAR_STRUCT,
     BOOST0_STRUCT, BOOSTI_STRUCT,
-    PARAMS
+    PARAM_SIG_BY_NAME_FMT, PARAM_SIG_FMT_BY_NAME
 )
 
+# Small packers with no dedicated record Struct in constants: the explicit
+# rpm preceding a flex signature and the comp/torque pair that follows it
+_RPM_U32 = struct.Struct('<I')
+_COMP_TQ = struct.Struct('<ff')
+
+
 def write_torque_row(data: bytearray, row: TorqueRow) -> None:
     """
     Writes all torque row values back to the binary data.
@@ -18,17 +32,17 @@ def write_torque_row(data: bytearray, row: TorqueRow) -> None:
     if row.kind == '0rpm':
         if row.torque is None:
             return
-        data_offset = row.offset + len(SIG_0RPM)
+        data_offset = row.offset + SIG_0RPM_LEN
         # Preserve the leading byte
         b0 = data[data_offset]
-        struct.pack_into('<Bff', data, data_offset, b0, row.compression, row.torque)
+        ROW0_STRUCT.pack_into(data, data_offset, b0, row.compression, row.torque)
 
     elif row.kind == '0rpm_alt':
-        data_offset = row.offset + len(SIG_0RPM_ALT)
+        data_offset = row.offset + SIG_0RPM_ALT_LEN
         # Preserve formatting bytes
         b0 = data[data_offset]
         b1 = data[data_offset+1]
-        struct.pack_into('<BBf', data, data_offset, b0, b1, row.compression)
+        ROW0_ALT_STRUCT.pack_into(data, data_offset, b0, b1, row.compression)
 
     elif row.kind == 'row_i':
         if row.torque is None:
@@ -37,7 +51,7 @@ def write_torque_row(data: bytearray, row: TorqueRow) -> None:
         if hasattr(row, 'exact_signature') and row.exact_signature:
             # Anomalous structures encode the RPM *before* the signature
             # Structure: <int32 rpm> <flex_signature> <float comp> <float torque>
-            rpm_bytes = struct.pack('<I', int(row.rpm))
+            rpm_bytes = _RPM_U32.pack(int(row.rpm))
             data[row.offset:row.offset+4] = rpm_bytes
             
             sig_start = row.offset + 4
@@ -45,25 +59,25 @@ def write_torque_row(data: bytearray, row: TorqueRow) -> None:
             data[sig_start:sig_start+sig_len] = row.exact_signature
             
             payload_start = sig_start + sig_len
-            struct.pack_into('<ff', data, payload_start, row.compression, row.torque)
+            _COMP_TQ.pack_into(data, payload_start, row.compression, row.torque)
         else:
             # Standard structures encode the signature *before* the RPM
             # Structure: <signature> <int32 rpm> <float comp> <float torque>
-            data_offset = row.offset + len(SIG_ROW_I)
-            struct.pack_into('<iff', data, data_offset, int(row.rpm), row.compression, row.torque)
+            data_offset = row.offset + SIG_ROW_I_LEN
+            ROWI_STRUCT.pack_into(data, data_offset, int(row.rpm), row.compression, row.torque)
 
     elif row.kind == 'row_f':
         if row.torque is None:
             return
-        data_offset = row.offset + len(SIG_ROW_F)
-        struct.pack_into('<fff', data, data_offset, row.rpm, row.compression, row.torque)
+        data_offset = row.offset + SIG_ROW_F_LEN
+        ROWF_STRUCT.pack_into(data, data_offset, row.rpm, row.compression, row.torque)
 
     elif row.kind == 'endvar':
-        data_offset = row.offset + len(SIG_ENDVAR)
+        data_offset = row.offset + SIG_ENDVAR_LEN
         # ENDVAR_STRUCT is <ifB: (int rpm, float compression, byte)
         # Preserve the trailing byte
         trailing_byte = data[data_offset + ENDVAR_STRUCT.size - 1]
-        struct.pack_into('<ifB', data, data_offset, int(row.rpm), row.compression, trailing_byte)
+        ENDVAR_STRUCT.pack_into(data, data_offset, int(row.rpm), row.compression, trailing_byte)
 
 
 def write_boost_row(data: bytearray, row: BoostRow) -> None:
@@ -72,55 +86,105 @@ def write_boost_row(data: bytearray, row: BoostRow) -> None:
     Handles boost_0rpm and boost_row kinds.
     """
     if row.kind == 'boost_0rpm':
-        data_offset = row.offset + len(SIG_BOOST_0RPM)
+        data_offset = row.offset + SIG_BOOST_0RPM_LEN
         # BOOST0_STRUCT is <Bfffff: (byte, 5 floats)
         # Preserve the leading byte
         b0 = data[data_offset]
-        struct.pack_into('<Bfffff', data, data_offset, b0, row.t0, row.t25, row.t50, row.t75, row.t100)
+        BOOST0_STRUCT.pack_into(data, data_offset, b0, row.t0, row.t25, row.t50, row.t75, row.t100)
 
     elif row.kind == 'boost_row':
-        data_offset = row.offset + len(SIG_BOOST_ROW)
+        data_offset = row.offset + SIG_BOOST_ROW_LEN
         # BOOSTI_STRUCT is <ifffff: (int rpm, 5 floats)
-        struct.pack_into('<ifffff', data, data_offset, int(row.rpm), row.t0, row.t25, row.t50, row.t75, row.t100)
+        BOOSTI_STRUCT.pack_into(data, data_offset, int(row.rpm), row.t0, row.t25, row.t50, row.t75, row.t100)
+
+
+@lru_cache(maxsize=None)
+def _param_struct(fmt: Tuple[str, ...]) -> struct.Struct:
+    """Packed little-endian Struct covering a whole parameter fmt tuple.
+
+    'f'/'i' map straight through; 'b' is an unsigned byte. There are only a
+    handful of distinct fmt tuples in PARAMS, so the cache stays tiny.
+    """
+    return struct.Struct('<' + ''.join('B' if c == 'b' else c for c in fmt))
 
 
 def write_param(data: bytearray, param: Parameter) -> None:
     """
     Writes the parameter values back to the binary data.
     """
-    sig_len = 0
-    fmt: Tuple[str, ...] = tuple()
-
-    if param.fmt:
-        fmt = param.fmt
-        for sig, (pname, pfmt) in PARAMS.items():
-            if pname == param.name:
-                sig_len = len(sig)
-                break
+    fmt: Tuple[str, ...] = param.fmt or tuple()
+    if fmt and (param.name, fmt) in PARAM_SIG_BY_NAME_FMT:
+        sig_len = len(PARAM_SIG_BY_NAME_FMT[(param.name, fmt)])
     else:
-        for sig, (pname, pfmt) in PARAMS.items():
-            if pname == param.name:
-                sig_len = len(sig)
-                fmt = pfmt
-                break
+        sig, default_fmt = PARAM_SIG_FMT_BY_NAME.get(param.name, (b'', ()))
+        sig_len = len(sig)
+        if not fmt:
+            fmt = default_fmt
 
     if not fmt:
         return
 
     data_offset = param.offset + sig_len
 
-    cur = data_offset
-    for i, f in enumerate(fmt):
-        val = param.values[i]
-        if f == 'f':
-            struct.pack_into('<f', data, cur, float(val))
-            cur += 4
-        elif f == 'i':
-            struct.pack_into('<i', data, cur, int(val))
-            cur += 4
-        elif f == 'b':
-            struct.pack_into('B', data, cur, int(val))
-            cur += 1
+    # One C-level pack of the whole record instead of a call per field
+    vals = [float(v) if c == 'f' else int(v) for c, v in zip(fmt, param.values)]
+    _param_struct(fmt).pack_into(data, data_offset, *vals)
+
+
+# Byte distance from row.offset to the five float32 throttle fields
+# ('boost_0rpm': sig + lead byte; 'boost_row': sig + int32 rpm)
+_BOOST_FIELD_OFFSET = {
+    'boost_0rpm': SIG_BOOST_0RPM_LEN + 1,
+    'boost_row':  SIG_BOOST_ROW_LEN + 4,
+}
+
+
+def scale_boost_tables(data: bytearray, tables: List[BoostTable], factor: float) -> None:
+    """
+    Scales all throttle boost values in the provided tables by a factor.
+    Updates both the binary data AND the table objects in-place, mirroring
+    scale_torque_tables.
+    """
+    if factor == 1.0:
+        return
+
+    rows = [row for table in tables for row in table.rows]
+    if not rows:
+        return
+
+    if np is None:
+        _write = write_boost_row
+        for row in rows:
+            row.t0 *= factor
+            row.t25 *= factor
+            row.t50 *= factor
+            row.t75 *= factor
+            row.t100 *= factor
+            _write(data, row)
+        return
+
+    # Vectorized path: one multiply over the (rows, 5) throttle matrix, one
+    # scatter of the 20-byte float32 payloads; rpm/lead bytes are untouched.
+    offsets = np.fromiter((row.offset + _BOOST_FIELD_OFFSET[row.kind] for row in rows),
+                          dtype=np.intp, count=len(rows))
+    vals = np.array([(row.t0, row.t25, row.t50, row.t75, row.t100) for row in rows],
+                    dtype=np.float64)
+    vals *= factor
+    for row, (t0, t25, t50, t75, t100) in zip(rows, vals.tolist()):
+        row.t0, row.t25, row.t50, row.t75, row.t100 = t0, t25, t50, t75, t100
+
+    view = np.frombuffer(data, dtype=np.uint8)
+    payload = vals.astype('<f4').view(np.uint8)
+    view[offsets[:, None] + np.arange(20)] = payload
+
+
+# Byte distance from row.offset to the float32 torque field, per kind
+# ('0rpm': sig + pad byte + comp; 'row_i'/'row_f': sig + rpm + comp)
+_TORQUE_FIELD_OFFSET = {
+    '0rpm':  SIG_0RPM_LEN + 1 + 4,
+    'row_i': SIG_ROW_I_LEN + 4 + 4,
+    'row_f': SIG_ROW_F_LEN + 4 + 4,
+}
 
 
 def scale_torque_tables(data: bytearray, tables: List[TorqueTable], factor: float) -> None:
@@ -128,8 +192,39 @@ def scale_torque_tables(data: bytearray, tables: List[TorqueTable], factor: floa
     Scales all torque values in the provided tables by a factor.
     Updates both the binary data AND the table objects in-place.
     """
-    for table in tables:
-        for row in table.rows:
-            if row.torque is not None:
-                row.torque *= factor
-                write_torque_row(data, row)
+    if factor == 1.0:
+        # 100% is a no-op; multiplying by 1.0 and re-packing would write
+        # back byte-identical payloads row by row
+        return
+
+    rows = [row for table in tables for row in table.rows if row.torque is not None]
+    if not rows:
+        return
+
+    if np is None:
+        _write = write_torque_row
+        for row in rows:
+            row.torque *= factor
+            _write(data, row)
+        return
+
+    # Vectorized path: scale the whole torque column in one multiply, then
+    # splat the float32 payloads back through a writable uint8 view. Only the
+    # torque field is rewritten; rpm/comp bytes are untouched.
+    offsets = np.empty(len(rows), dtype=np.intp)
+    torques = np.empty(len(rows), dtype=np.float64)
+    for k, row in enumerate(rows):
+        if row.exact_signature and row.kind == 'row_i':
+            # Anomalous layout: <rpm u32> <exact signature> <comp f32> <tq f32>
+            offsets[k] = row.offset + 4 + len(row.exact_signature) + 4
+        else:
+            offsets[k] = row.offset + _TORQUE_FIELD_OFFSET[row.kind]
+        torques[k] = row.torque
+
+    torques *= factor
+    for row, tq in zip(rows, torques.tolist()):
+        row.torque = tq
+
+    view = np.frombuffer(data, dtype=np.uint8)
+    payload = torques.astype('<f4').view(np.uint8).reshape(-1, 4)
+    view[offsets[:, None] + np.arange(4)] = payload
@@ -2,6 +2,9 @@ import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, simpledialog
 import logging
 import csv
+import mmap
+import os
+from concurrent.futures import ThreadPoolExecutor
 
 from ..core.parser import parse_torque_tables, parse_boost_tables, parse_params, detect_engine_layout
 from ..core.writer import write_torque_row, write_param, scale_torque_tables
@@ -22,6 +25,18 @@ class EDFEditorApp(tk.Tk):
         self._interactive_plot_open = False
         self._interactive_plot = None
         self._dirty = False
+        # Single worker for file writes so saving a large EDF never blocks
+        # the Tk event loop; completion is observed by polling from the
+        # main thread (Tk calls are not thread-safe).
+        self._io_pool = ThreadPoolExecutor(max_workers=1)
+        self._save_in_flight = False
+        # Bumped on every load/close; a save completion from a previous
+        # generation must not touch the UI or adopt its target path
+        self._file_gen = 0
+        # Dirty hex spans awaiting repaint, coalesced per event-loop turn so
+        # rapid edits (e.g. interactive drags) repaint each line once
+        self._pending_spans = []
+        self._hex_flush_scheduled = False
         
         self._setup_menu()
         self._setup_layout()
@@ -85,15 +100,29 @@ class EDFEditorApp(tk.Tk):
             
         try:
             with open(path, 'rb') as f:
-                self.data = bytearray(f.read())
+                # Build the working bytearray straight from the mapped pages:
+                # no intermediate bytes object, so peak allocation is one copy
+                # of the file instead of two. mmap rejects empty files.
+                try:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        self.data = bytearray(mm)
+                except ValueError:
+                    self.data = bytearray(f.read())
             
+            self._file_gen += 1
             self.current_file = path
             self._set_dirty(False)
             
-            # Parse
-            self.tables = parse_torque_tables(self.data)
-            self.boost = parse_boost_tables(self.data)
-            self.params = parse_params(self.data)
+            # Parse — three independent scans over the same buffer; the
+            # regex/NumPy hot paths release the GIL, so running them on a
+            # transient pool overlaps them on multi-core machines.
+            with ThreadPoolExecutor(max_workers=3) as ex:
+                f_torque = ex.submit(parse_torque_tables, self.data)
+                f_boost = ex.submit(parse_boost_tables, self.data)
+                f_params = ex.submit(parse_params, self.data)
+                self.tables = f_torque.result()
+                self.boost = f_boost.result()
+                self.params = f_params.result()
             
             # Populate UI
             self.tree.populate(self.tables, self.boost, self.params)
@@ -112,21 +141,79 @@ class EDFEditorApp(tk.Tk):
         self.file_menu.entryconfig("Save As...", state='normal')
         self.file_menu.entryconfig("Close", state='normal')
 
+    @staticmethod
+    def _write_bytes(path, payload: bytes):
+        """Atomically replace `path` with `payload`.
+
+        Writes to a sibling temp file in 1 MiB slices, fsyncs, then renames
+        over the target so a crash mid-save never leaves a truncated EDF.
+        """
+        tmp = path + '.tmp'
+        try:
+            # buffering=0: each memoryview slice goes straight to the OS
+            # instead of round-tripping through BufferedWriter's copy
+            with open(tmp, 'wb', buffering=0) as f:
+                mv = memoryview(payload)
+                for i in range(0, len(mv), 1 << 20):
+                    f.write(mv[i:i + (1 << 20)])
+                os.fsync(f.fileno())
+            os.replace(tmp, path)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+
+    def _submit_save(self, path, on_success=None):
+        """Write a snapshot of self.data to `path` on the I/O worker.
+
+        Save entries are disabled while the write is in flight so a second
+        save cannot be submitted; the snapshot means later edits cannot race
+        the write. The current file generation is captured so a completion
+        that lands after a close or a new load leaves that state alone.
+        """
+        snapshot = bytes(self.data)
+        self._save_in_flight = True
+        self.file_menu.entryconfig("Save", state='disabled')
+        self.file_menu.entryconfig("Save As...", state='disabled')
+        future = self._io_pool.submit(self._write_bytes, path, snapshot)
+        self._poll_save(future, path, on_success, self._file_gen)
+
+    def _poll_save(self, future, path, on_success, gen):
+        if not future.done():
+            self.after(50, self._poll_save, future, path, on_success, gen)
+            return
+        self._save_in_flight = False
+        if gen != self._file_gen:
+            # The file was closed or replaced while the write was in
+            # flight: the menus/title/current_file now describe the new
+            # state, so don't re-enable, adopt the path, or clear dirty.
+            # The snapshot still reached disk; only surface a failure.
+            exc = future.exception()
+            if exc is not None:
+                messagebox.showerror("Error", f"Failed to save: {exc}")
+            return
+        self.file_menu.entryconfig("Save", state='normal')
+        self.file_menu.entryconfig("Save As...", state='normal')
+        exc = future.exception()
+        if exc is not None:
+            messagebox.showerror("Error", f"Failed to save: {exc}")
+            return
+        if on_success is not None:
+            on_success()
+        self._set_dirty(False)
+        messagebox.showinfo("Success", f"Saved to {path}")
+
     def save_file(self):
         """Save to the current file (overwrite original)."""
-        if not self.data or not self.current_file:
+        if not self.data or not self.current_file or self._save_in_flight:
             return
-        try:
-            with open(self.current_file, 'wb') as f:
-                f.write(self.data)
-            self._set_dirty(False)
-            messagebox.showinfo("Success", f"Saved to {self.current_file}")
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to save: {e}")
+        self._submit_save(self.current_file)
 
     def save_file_as(self):
         """Save to a new file path."""
-        if not self.data:
+        if not self.data or self._save_in_flight:
             return
         path = filedialog.asksaveasfilename(
             defaultextension=".edf",
@@ -134,17 +221,15 @@ class EDFEditorApp(tk.Tk):
         )
         if not path:
             return
-        try:
-            with open(path, 'wb') as f:
-                f.write(self.data)
+
+        def _adopt_path():
             self.current_file = path
-            self._set_dirty(False)
-            messagebox.showinfo("Success", f"Saved to {path}")
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to save: {e}")
+
+        self._submit_save(path, on_success=_adopt_path)
 
     def close_file(self):
         """Close the current EDF file and reset the UI."""
+        self._file_gen += 1
         self.data = None
         self.current_file = None
         self.tables = []
@@ -160,17 +245,39 @@ class EDFEditorApp(tk.Tk):
         self.file_menu.entryconfig("Save As...", state='disabled')
         self.file_menu.entryconfig("Close", state='disabled')
 
+    def _schedule_hex_patch(self, start, end):
+        """Queue a dirty byte span and repaint at most once per idle turn."""
+        self._pending_spans.append((start, end))
+        if not self._hex_flush_scheduled:
+            self._hex_flush_scheduled = True
+            self.after_idle(self._flush_hex_patches)
+
+    def _flush_hex_patches(self):
+        self._hex_flush_scheduled = False
+        spans, self._pending_spans = self._pending_spans, []
+        if not spans:
+            return
+        spans.sort()
+        cur_s, cur_e = spans[0]
+        for s, e in spans[1:]:
+            # Merge spans that touch the same 16-byte line
+            if s // 16 <= (cur_e - 1) // 16 + 1:
+                cur_e = max(cur_e, e)
+            else:
+                self.hex_view.patch(cur_s, cur_e)
+                cur_s, cur_e = s, e
+        self.hex_view.patch(cur_s, cur_e)
+
     def on_tree_double_click(self, event):
         sel = self.tree.selection()
         if not sel:
             return
         
         item_id = sel[0]
-        if item_id not in self.tree.item_map:
+        obj = self.tree.get_object(item_id)
+        if obj is None:
             return
-            
-        obj = self.tree.item_map[item_id]
-        
+
         from .dialogs import EditTorqueDialog, EditParamDialog
         from ..core.models import TorqueRow, Parameter
         
@@ -190,26 +297,16 @@ class EDFEditorApp(tk.Tk):
         # callback from dialog
         # 1. Write to binary
         write_torque_row(self.data, row)
-        # 2. Refresh UI
-        # We need to refresh the tree item and hex view
-        # For simplicity, reload hex view entirely? Efficient enough for 2MB files.
-        self.hex_view.load_data(self.data)
-        # Refresh tree item logic?
-        # self.tree.item(item_id, values=...)
-        # We need to find item_id for this row object.
-        # TreeView doesn't support reverse lookup easily unless we store it.
-        # But we can just Repopulate or ask TreeView to refresh specific item if we pass ID.
-        # Dialog doesn't know ID.
-        # We could pass ID to dialog?
-        # Or just repopulate entire tree? (Slower but safer)
-        # Or update data and re-populate.
-        self.tree.populate(self.tables, self.boost, self.params)
+        # 2. Refresh UI — the in-memory row is authoritative, so no re-parse:
+        # redraw just the hex lines the write touched and repopulate the tree.
+        self._schedule_hex_patch(row.offset, row.offset + row.size)
+        self.tree.update_torque_row(row)
         self._set_dirty(True)
 
     def on_param_update(self, param):
         write_param(self.data, param)
-        self.hex_view.load_data(self.data)
-        self.tree.populate(self.tables, self.boost, self.params)
+        self._schedule_hex_patch(param.offset, param.offset + param.size)
+        self.tree.update_param(param)
         self._set_dirty(True)
 
     def on_tree_select(self, event):
@@ -219,8 +316,8 @@ class EDFEditorApp(tk.Tk):
         
         item_id = sel[0]
         # Check if item has associated data object
-        if item_id in self.tree.item_map:
-            obj = self.tree.item_map[item_id]
+        obj = self.tree.get_object(item_id)
+        if obj is not None:
             # Verify object has offset and size (Paranoia check, or type check)
             if hasattr(obj, 'offset') and hasattr(obj, 'size'):
                 start = obj.offset
@@ -330,14 +427,21 @@ class EDFEditorApp(tk.Tk):
         if not path: return
         
         try:
-            with open(path, 'w', newline='', encoding='utf-8') as f:
+            src = self.current_file or ''
+            # Large buffer + writerows: the CSV encoder runs over one
+            # generator instead of a Python call per row, and the OS sees a
+            # few big writes instead of thousands of small ones.
+            with open(path, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
                 w = csv.writer(f)
                 w.writerow(['table_index','row_index','rpm','compression','torque','row_kind','payload_offset_hex','source_file'])
-                for t_idx, table in enumerate(self.tables):
-                    for r_idx, row in enumerate(table.rows):
-                        tq_val = '' if row.torque is None else row.torque
-                        # Offset is signature offset now
-                        w.writerow([t_idx, r_idx, row.rpm, row.compression, tq_val, row.kind, f"0x{row.offset:X}", self.current_file or ''])
+                # Offset is signature offset now
+                w.writerows(
+                    (t_idx, r_idx, row.rpm, row.compression,
+                     '' if row.torque is None else row.torque,
+                     row.kind, f"0x{row.offset:X}", src)
+                    for t_idx, table in enumerate(self.tables)
+                    for r_idx, row in enumerate(table.rows)
+                )
             messagebox.showinfo("Saved", f"CSV saved:\n{path}")
         except Exception as e:
             logger.exception("CSV export failed")
@@ -357,10 +461,18 @@ class EDFEditorApp(tk.Tk):
         factor = percent / 100.0
         
         scale_torque_tables(self.data, self.tables, factor)
-        
-        # Refresh UI
-        self.hex_view.load_data(self.data)
-        self.tree.populate(self.tables, self.boost, self.params)
+
+        # Refresh UI — only the byte span covered by the torque tables changed
+        rows = [row for table in self.tables for row in table.rows]
+        if rows:
+            start = min(r.offset for r in rows)
+            end = max(r.offset + r.size for r in rows)
+            self._schedule_hex_patch(start, end)
+        # Only torque floats changed; mutate the visible row items in place
+        # (rows in still-collapsed tables render fresh values on expand)
+        for table in self.tables:
+            for row in table.rows:
+                self.tree.update_torque_row(row)
         self._set_dirty(True)
         
         messagebox.showinfo("Success", f"Scaled torque by {percent}%")
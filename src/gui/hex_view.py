@@ -1,45 +1,108 @@
 import tkinter as tk
 
+# Optional, matching the parser/writer: with NumPy the full dump is rendered
+# by table lookups over the whole buffer instead of a Python loop per line.
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Printable ASCII passes through, everything else becomes '.'
+_ASCII_TRANS = bytes(b if 32 <= b < 127 else 0x2E for b in range(256))
+
+if np is not None:
+    # byte value -> its two uppercase hex digits / its printable-ASCII char
+    _HEX_LUT = np.frombuffer(b''.join(b'%02X' % i for i in range(256)),
+                             dtype=np.uint8).reshape(256, 2)
+    _ASCII_LUT = np.frombuffer(_ASCII_TRANS, dtype=np.uint8)
+
+
 class HexView(tk.Text):
     def __init__(self, master=None, **kwargs):
         super().__init__(master, **kwargs)
         self.config(state='disabled', font=("Courier", 10))
         self.tag_configure("highlight", background="yellow", foreground="black")
+        # Reference to the buffer shown by the last load_data; the app
+        # mutates it in place, so patch() can re-render lines from it
+        self._data = b''
         
+    @staticmethod
+    def _format_line(data: bytes, i: int) -> str:
+        chunk = bytes(data[i:i+16])
+
+        # Hex part — one C-level bytes.hex per half, extra gap after the 8th byte
+        left = chunk[:8].hex(' ').upper()
+        right = chunk[8:].hex(' ').upper()
+        hex_str = (f"{left}  {right}" if right else left).ljust(49)  # 16*3 + 1 = 49
+
+        # Ascii part — one C-level translate instead of a per-byte generator
+        ascii_part = chunk.translate(_ASCII_TRANS).decode('ascii')
+
+        return f"{i:08X}  {hex_str}  |{ascii_part}|"
+
     def load_data(self, data: bytes):
+        self._data = data
         self.config(state='normal')
-        self.delete('1.0', tk.END)
-        
+
         # Format:
         # Offset   Hex................................  Ascii
         # 00000000 00 01 02 03 04 05 06 07  08 09 0A 0B 0C 0D 0E 0F  |................|
-        
-        lines = []
-        for i in range(0, len(data), 16):
-            chunk = data[i:i+16]
-            
-            # Hex part
-            hex_part = []
-            for j, b in enumerate(chunk):
-                hex_part.append(f"{b:02X}")
-                if j == 7: # Extra space
-                    hex_part.append("")
-            
-            # Pad hex part if last line is short
-            if len(chunk) < 16:
-                padding = 16 - len(chunk)
-                # 3 chars per byte + 1 space for 8th byte if missing
-                # Actually simplest way is just to fill hex_part list
-                pass
-            
-            hex_str = " ".join(hex_part).ljust(49) # 16*3 + 1 = 49
-            
-            # Ascii part
-            ascii_part = "".join(chr(b) if 32 <= b < 127 else "." for b in chunk)
-            
-            lines.append(f"{i:08X}  {hex_str}  |{ascii_part}|")
-            
-        self.insert('1.0', "\n".join(lines))
+
+        # replace() swaps the content in one Tcl round-trip (vs delete+insert)
+        self.replace('1.0', tk.END, self._render_dump(data))
+        self.config(state='disabled')
+
+    @classmethod
+    def _render_dump(cls, data: bytes) -> str:
+        """Render the whole dump; output matches joining _format_line lines."""
+        full = len(data) // 16
+        if np is None or full == 0:
+            return "\n".join(cls._format_line(data, i)
+                             for i in range(0, len(data), 16))
+
+        # Vectorized path: every complete 16-byte line is 80 chars
+        # (79 + newline); fill one uint8 matrix with table lookups and decode
+        # it in a single pass. Only the ragged last line stays scalar.
+        arr = np.frombuffer(data, dtype=np.uint8, count=full * 16).reshape(full, 16)
+        out = np.full((full, 80), 0x20, dtype=np.uint8)  # spaces
+
+        offs = (np.arange(full, dtype=np.int64) * 16).astype('>u4')
+        out[:, 0:8] = _HEX_LUT[offs.view(np.uint8).reshape(full, 4)].reshape(full, 8)
+
+        for k in range(16):
+            col = 10 + 3 * k + (1 if k >= 8 else 0)  # extra gap after 8th byte
+            out[:, col:col + 2] = _HEX_LUT[arr[:, k]]
+
+        out[:, 61] = 0x7C  # '|'
+        out[:, 62:78] = _ASCII_LUT[arr]
+        out[:, 78] = 0x7C
+        out[:, 79] = 0x0A  # '\n'
+
+        text = out.tobytes().decode('ascii')
+        if len(data) % 16:
+            return text + cls._format_line(data, full * 16)
+        return text[:-1]  # no trailing newline, same as the join
+
+    def patch(self, start: int, end: int):
+        """Re-render only the lines covering bytes [start, end).
+
+        Used after an in-place edit of the buffer shown by the last
+        load_data, so a few-byte write does not rebuild the whole Text
+        widget. The buffer length must be unchanged; highlight tags on the
+        redrawn lines are dropped (the next selection re-applies them).
+        """
+        data = self._data
+        if start >= end:
+            return
+        end = min(end, len(data))
+
+        first_line = (start // 16) + 1
+        last_line = ((end - 1) // 16) + 1
+        lines = [self._format_line(data, i)
+                 for i in range((first_line - 1) * 16, last_line * 16, 16)]
+
+        self.config(state='normal')
+        self.replace(f"{first_line}.0", f"{last_line}.end", "\n".join(lines))
         self.config(state='disabled')
         
     def highlight_range(self, start: int, end: int):
@@ -7,13 +7,18 @@ from ..core.constants import PARAM_META
 from ..utils.formatting import format_float
 
 class EDFTreeView(ttk.Treeview):
+    # The Treeview style is process-global; configure it once, not per instance
+    _style_configured = False
+
     def __init__(self, master=None, **kwargs):
         super().__init__(master, **kwargs)
-        
+
         # Increase row height to prevent clipping on High DPI displays
-        style = ttk.Style()
-        style.configure("Treeview", rowheight=28)
-        
+        if not EDFTreeView._style_configured:
+            style = ttk.Style()
+            style.configure("Treeview", rowheight=28)
+            EDFTreeView._style_configured = True
+
         # Columns must be declared BEFORE configuring headings
         self['columns'] = ("col1", "col2", "col3")
         
@@ -27,77 +32,170 @@ class EDFTreeView(ttk.Treeview):
         self.column("col2", width=150)
         self.column("col3", width=150)
         
-        # Mapping from item_id to data object (for editing)
-        self.item_map = {} 
-        
+        # Mapping from item_id to a compact ('torque'|'boost'|'param',
+        # container_index, row_index) triple; resolved via get_object()
+        self.item_map = {}
+        # Inverse mapping from id(obj) to item_id so edits can mutate a
+        # single tree item instead of repopulating everything
+        self.obj_to_item = {}
+        # Table nodes whose row children have not been inserted yet
+        # (item_id -> ('torque'|'boost', table_index)); filled on <<TreeviewOpen>>
+        self._pending = {}
+        # The lists handed to the last populate(), for get_object resolution
+        self._tables = []
+        self._boost_tables = []
+        self._params = []
+        self.bind('<<TreeviewOpen>>', self._on_node_open)
+
     def clear(self):
         self.delete(*self.get_children())
         self.item_map.clear()
-        
+        self.obj_to_item.clear()
+        self._pending.clear()
+
+    def get_object(self, item_id):
+        """Resolve a tree item id to its TorqueRow/BoostRow/Parameter."""
+        ref = self.item_map.get(item_id)
+        if ref is None:
+            return None
+        kind, c_idx, r_idx = ref
+        if kind == 'torque':
+            return self._tables[c_idx].rows[r_idx]
+        if kind == 'boost':
+            return self._boost_tables[c_idx].rows[r_idx]
+        return self._params[c_idx]
+
     def populate(self, tables: List[TorqueTable], boost_tables: List[BoostTable], params: List[Parameter]):
         self.clear()
-        
+        self._tables = tables
+        self._boost_tables = boost_tables
+        self._params = params
+
         # Root nodes
         tt_root = self.insert('', 'end', text=f"Torque tables found: {len(tables)}", open=True)
         bt_root = self.insert('', 'end', text=f"Boost tables found: {len(boost_tables)}", open=True)
         pr_root = self.insert('', 'end', text=f"Parameters found: {len(params)}", open=True)
-        
-        # Torque Tables
+
+        # Torque/Boost tables: insert the table nodes only, with a sentinel
+        # child so they can be expanded; the real rows are inserted lazily on
+        # first expand. This keeps Tcl calls at O(tables) instead of O(rows).
         for t_idx, table in enumerate(tables):
-            tnode = self.insert(tt_root, 'end', 
-                                text=f"Table {t_idx} @ 0x{table.offset:X} (rows={len(table.rows)})", 
+            tnode = self.insert(tt_root, 'end',
+                                text=f"Table {t_idx} @ 0x{table.offset:X} (rows={len(table.rows)})",
                                 values=('', '', ''))
-            
-            self.insert(tnode, 'end', text="Columns: RPM, Compression (-Nm), Torque (Nm)", values=('', '', ''))
-            
-            for i, row in enumerate(table.rows):
-                tq_str = '' if row.torque is None else format_float(row.torque, 3)
-                item_id = self.insert(tnode, 'end',
-                                     text=f"Row {i:02d} [{row.kind}] @ 0x{row.offset:X}",
-                                     values=(format_float(row.rpm, 1), format_float(row.compression, 3), tq_str))
-                self.item_map[item_id] = row
-
-        # Boost Tables
+            self.insert(tnode, 'end', text="…", values=('', '', ''))
+            self._pending[tnode] = ('torque', t_idx)
+
         for b_idx, table in enumerate(boost_tables):
-            bnode = self.insert(bt_root, 'end', 
-                                text=f"Boost Table {b_idx} @ 0x{table.offset:X} (rows={len(table.rows)})", 
+            bnode = self.insert(bt_root, 'end',
+                                text=f"Boost Table {b_idx} @ 0x{table.offset:X} (rows={len(table.rows)})",
                                 values=('', '', ''))
-            
-            self.insert(bnode, 'end', text="Columns: RPM, Throttle 0%, 25%, 50%, 75%, 100% (bar)", values=('', '', ''))
-            
-            for i, row in enumerate(table.rows):
-                item_id = self.insert(bnode, 'end',
-                                     text=f"Row {i:02d} [{row.kind}] @ 0x{row.offset:X}",
-                                     values=(format_float(row.t0, 3), format_float(row.t25, 3), format_float(row.t50, 3)))
-                self.insert(bnode, 'end',
-                           text=f"  → Throttle 75%={format_float(row.t75, 3)}, 100%={format_float(row.t100, 3)}",
-                           values=('', '', ''))
-                self.item_map[item_id] = row
-
-        # Parameters — with labels and type annotations
-        sorted_params = sorted(params, key=lambda x: x.offset)
-        for param in sorted_params:
-            vals = param.values
-            meta = PARAM_META.get(param.name, ())
-            
-            def _fmt_field(v, idx):
-                """Format a value with its label and type from PARAM_META."""
-                if idx < len(meta):
-                    label, type_str = meta[idx]
-                    if isinstance(v, float):
-                        return f"{label}= {format_float(v, 6)} ({type_str})"
-                    else:
-                        return f"{label}= {v} ({type_str})"
+            self.insert(bnode, 'end', text="…", values=('', '', ''))
+            self._pending[bnode] = ('boost', b_idx)
+
+        # Parameters — with labels and type annotations; parse_params already
+        # yields them in offset order
+        for p_idx, param in enumerate(params):
+            item_id = self.insert(pr_root, 'end',
+                                 text=f"{param.name} @ 0x{param.offset:X}",
+                                 values=self._param_values(param))
+            self.item_map[item_id] = ('param', p_idx, 0)
+            self.obj_to_item[id(param)] = item_id
+
+    @staticmethod
+    def _param_values(param: Parameter):
+        """Display tuple for a parameter, with labels/types from PARAM_META."""
+        vals = param.values
+        meta = PARAM_META.get(param.name, ())
+
+        def _fmt_field(v, idx):
+            if idx < len(meta):
+                label, type_str = meta[idx]
+                if isinstance(v, float):
+                    return f"{label}= {format_float(v, 6)} ({type_str})"
                 else:
-                    if isinstance(v, float):
-                        return format_float(v, 6)
-                    return str(v)
-            
-            v1 = _fmt_field(vals[0], 0) if len(vals) > 0 else ''
-            v2 = _fmt_field(vals[1], 1) if len(vals) > 1 else ''
-            v3 = _fmt_field(vals[2], 2) if len(vals) > 2 else ''
-            
-            item_id = self.insert(pr_root, 'end', 
-                                 text=f"{param.name} @ 0x{param.offset:X}", 
-                                 values=(v1, v2, v3))
-            self.item_map[item_id] = param
+                    return f"{label}= {v} ({type_str})"
+            else:
+                if isinstance(v, float):
+                    return format_float(v, 6)
+                return str(v)
+
+        v1 = _fmt_field(vals[0], 0) if len(vals) > 0 else ''
+        v2 = _fmt_field(vals[1], 1) if len(vals) > 1 else ''
+        v3 = _fmt_field(vals[2], 2) if len(vals) > 2 else ''
+        return (v1, v2, v3)
+
+    @staticmethod
+    def _torque_row_values(row):
+        """Display tuple for a torque row."""
+        tq_str = '' if row.torque is None else format_float(row.torque, 3)
+        return (format_float(row.rpm, 1), format_float(row.compression, 3), tq_str)
+
+    def update_torque_row(self, row) -> bool:
+        """Refresh the single tree item showing `row`, if it exists.
+
+        Rows inside a still-collapsed table have no item yet; they pick up
+        the new values when the table is first expanded, so that case is a
+        no-op. Returns True when an item was updated.
+        """
+        item_id = self.obj_to_item.get(id(row))
+        if item_id is None:
+            return False
+        self.item(item_id, values=self._torque_row_values(row))
+        return True
+
+    def update_param(self, param: Parameter) -> bool:
+        """Refresh the single tree item showing `param`."""
+        item_id = self.obj_to_item.get(id(param))
+        if item_id is None:
+            return False
+        self.item(item_id, values=self._param_values(param))
+        return True
+
+    def _on_node_open(self, event):
+        """Insert the real row children of a table node on first expand."""
+        node = self.focus()
+        pending = self._pending.pop(node, None)
+        if pending is None:
+            return
+
+        kind, t_idx = pending
+        self.delete(*self.get_children(node))  # drop the sentinel
+
+        # Detach the node while its rows are inserted so the widget does not
+        # redraw/relayout once per insert; move() reattaches it in place.
+        parent = self.parent(node)
+        idx = self.index(node)
+        self.detach(node)
+        try:
+            if kind == 'torque':
+                self._insert_torque_rows(node, t_idx)
+            else:
+                self._insert_boost_rows(node, t_idx)
+        finally:
+            self.move(node, parent, idx)
+
+    def _insert_torque_rows(self, tnode, t_idx: int):
+        table = self._tables[t_idx]
+        self.insert(tnode, 'end', text="Columns: RPM, Compression (-Nm), Torque (Nm)", values=('', '', ''))
+
+        for i, row in enumerate(table.rows):
+            item_id = self.insert(tnode, 'end',
+                                 text=f"Row {i:02d} [{row.kind}] @ 0x{row.offset:X}",
+                                 values=self._torque_row_values(row))
+            self.item_map[item_id] = ('torque', t_idx, i)
+            self.obj_to_item[id(row)] = item_id
+
+    def _insert_boost_rows(self, bnode, b_idx: int):
+        table = self._boost_tables[b_idx]
+        self.insert(bnode, 'end', text="Columns: RPM, Throttle 0%, 25%, 50%, 75%, 100% (bar)", values=('', '', ''))
+
+        for i, row in enumerate(table.rows):
+            item_id = self.insert(bnode, 'end',
+                                 text=f"Row {i:02d} [{row.kind}] @ 0x{row.offset:X}",
+                                 values=(format_float(row.t0, 3), format_float(row.t25, 3), format_float(row.t50, 3)))
+            self.insert(bnode, 'end',
+                       text=f"  → Throttle 75%={format_float(row.t75, 3)}, 100%={format_float(row.t100, 3)}",
+                       values=('', '', ''))
+            self.item_map[item_id] = ('boost', b_idx, i)
+            self.obj_to_item[id(row)] = item_id
@@ -3,10 +3,12 @@ import os
 import logging
 import ctypes
 
-# Windows High DPI awareness (FR11) — must be called before any Tkinter init
+# Windows High DPI awareness (FR11) — must be called before any Tkinter init.
+# AttributeError: not on Windows (ctypes.windll missing); OSError: the
+# shcore call itself failed. Anything else should surface.
 try:
     ctypes.windll.shcore.SetProcessDpiAwareness(1)
-except Exception:
+except (AttributeError, OSError):
     pass
 
 # Ensure the project root (parent of src/) is on sys.path
@@ -14,8 +16,6 @@ _project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 if _project_root not in sys.path:
     sys.path.insert(0, _project_root)
 
-from src.gui.app import EDFEditorApp
-
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -26,6 +26,11 @@ logging.basicConfig(
 )
 
 def main():
+    # Imported here so that importing src.main (e.g. from a headless/batch
+    # context) does not pull in tkinter; matplotlib is already lazy via
+    # plotting._ensure_matplotlib.
+    from src.gui.app import EDFEditorApp
+
     app = EDFEditorApp()
     app.mainloop()
 
@@ -1,6 +1,12 @@
 """Shared formatting utilities for float display."""
 
 import struct
+from functools import lru_cache
+
+
+@lru_cache(maxsize=8192)
+def _format_float_cached(val: float, decimals: int) -> str:
+    return f"{val:.{decimals}f}"
 
 
 def format_float(val: float, decimals: int = 6) -> str:
@@ -13,7 +19,12 @@ def format_float(val: float, decimals: int = 6) -> str:
     Returns:
         A string like '123.456000', never '1.23e+02'.
     """
-    return f"{val:.{decimals}f}"
+    if val == 0.0:
+        # 0.0 and -0.0 hash/compare equal, so they would share one cache
+        # slot and whichever came first would decide the sign for both;
+        # format them directly to keep '0.000' and '-0.000' distinct.
+        return f"{val:.{decimals}f}"
+    return _format_float_cached(val, decimals)
 
 
 def quantise_f32(val: float) -> float:
@@ -147,7 +147,7 @@ class DraggableTorquePlot:
             # Build list of draggable rows (skip endvar)
             draggable_rows = [r for r in table.rows if r.torque is not None]
 
-            if rpms:
+            if len(rpms):
                 tc = TORQUE_COLORS[t_idx % len(TORQUE_COLORS)]
                 pc = POWER_COLORS[t_idx % len(POWER_COLORS)]
 
@@ -220,7 +220,7 @@ class DraggableTorquePlot:
             rpms, _torques, comps, _powers = extract_curve_data(table)
             draggable_rows = [r for r in table.rows if r.torque is not None]
 
-            if rpms:
+            if len(rpms):
                 line_c, = self.ax1.plot(
                     rpms, comps,
                     marker='o', linewidth=2, markersize=6,
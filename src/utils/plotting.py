@@ -1,19 +1,69 @@
 import logging
+from functools import lru_cache
 from typing import List, Optional, Tuple
 from pathlib import Path
 
 from ..core.models import TorqueTable
 
+# Optional, matching the parser: with NumPy the curve columns are handed to
+# matplotlib as arrays and the power math is vectorized.
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 logger = logging.getLogger(__name__)
 
 # Color schemes shared across plot modes
 TORQUE_COLORS = ['#1f77b4', '#2ca02c', '#9467bd', '#8c564b']
 POWER_COLORS = ['#ff7f0e', '#ff9f3f', '#ffbf7f', '#ffd9a6']
 
+# Paired per-table colors, zipped once; one modulo index per table
+_COLOR_CYCLE = list(zip(TORQUE_COLORS, POWER_COLORS))
+
+# Power (kW) = Torque (Nm) × RPM / 9549.3; multiply by the reciprocal
+_INV_RPM_TO_KW = 1.0 / 9549.3
+
+if np is not None:
+    # One record per row: a single fromiter pass instead of per-column lists
+    _CURVE_DTYPE = np.dtype([('rpm', 'f8'), ('comp', 'f8'), ('tq', 'f8')])
+
+
+# Figure/axes reuse for replot-after-edit workflows: plot mode ->
+# (pyplot module, Figure, axes tuple). Keyed on the module too so a
+# different pyplot (e.g. a test double) never gets a stale figure.
+_FIG_CACHE = {}
+
+
+def clear_plot_cache():
+    """Drop cached figures so the next plot call builds fresh ones."""
+    _FIG_CACHE.clear()
+
 
+def _cached_subplots(key, plt, factory):
+    """Reuse the figure/axes from the last plot of this mode if its window
+    is still open (cleared via cla()); otherwise build them with factory.
+    Skips matplotlib's artist construction on every replot."""
+    cached = _FIG_CACHE.get(key)
+    if cached is not None:
+        cached_plt, fig, axes = cached
+        if cached_plt is plt and plt.fignum_exists(fig.number):
+            for ax in axes:
+                ax.cla()
+            return fig, axes
+    fig, axes = factory()
+    _FIG_CACHE[key] = (plt, fig, axes)
+    return fig, axes
+
+
+@lru_cache(maxsize=1)
 def _ensure_matplotlib():
     """
     Attempts to import matplotlib. Raises ImportError if not found.
+
+    Memoized: the first call pays the import cost, later calls are a
+    dict hit. lru_cache does not cache exceptions, so a missing
+    matplotlib still raises on every call.
     """
     try:
         import matplotlib.pyplot as plt
@@ -24,7 +74,7 @@ def _ensure_matplotlib():
 
 
 def extract_curve_data(table: TorqueTable) -> Tuple[List[float], List[float], List[float], List[float]]:
-    """Extract plottable data arrays from a single TorqueTable.
+    """Extract plottable data columns from a single TorqueTable.
 
     Skips endvar rows (where torque is None).
 
@@ -32,20 +82,36 @@ def extract_curve_data(table: TorqueTable) -> Tuple[List[float], List[float], Li
         table: A TorqueTable with rows to extract.
 
     Returns:
-        Tuple of (rpms, torques, compressions, powers_kw).
-        All lists are the same length. Power = Torque × RPM / 9549.3.
+        Tuple of (rpms, torques, compressions, powers_kw) columns, all the
+        same length. With NumPy installed these are float ndarrays (consumed
+        directly by matplotlib, power computed vectorized); otherwise plain
+        lists. Power = Torque × RPM / 9549.3.
     """
+    rows = table.rows
+
+    if np is not None:
+        # Single pass into one structured array; endvar rows (torque None)
+        # become NaN and are dropped by the mask in one vectorized compare.
+        arr = np.fromiter(
+            ((r.rpm, r.compression, r.torque if r.torque is not None else np.nan)
+             for r in rows),
+            dtype=_CURVE_DTYPE, count=len(rows))
+        mask = ~np.isnan(arr['tq'])
+        rpms = arr['rpm'][mask]
+        torques = arr['tq'][mask]
+        compressions = arr['comp'][mask]
+        powers = torques * rpms * _INV_RPM_TO_KW
+        return rpms, torques, compressions, powers
+
     rpms = []
     torques = []
     compressions = []
-    powers = []
-
-    for row in table.rows:
+    for row in rows:
         if row.torque is not None:
             rpms.append(row.rpm)
             torques.append(row.torque)
             compressions.append(row.compression)
-            powers.append((row.torque * row.rpm) / 9549.3)
+    powers = [tq * rpm * _INV_RPM_TO_KW for tq, rpm in zip(torques, rpms)]
 
     return rpms, torques, compressions, powers
 
@@ -59,19 +125,20 @@ def plot_torque_rpm(tables: List[TorqueTable], filename: str = "EDF File"):
         return
 
     plt = _ensure_matplotlib()
-    
-    fig, ax1 = plt.subplots(figsize=(10, 6))
-    
-    # Create second y-axis for power
-    ax2 = ax1.twinx()
-    
+
+    def _make():
+        fig, ax1 = plt.subplots(figsize=(10, 6))
+        # Create second y-axis for power
+        return fig, (ax1, ax1.twinx())
+
+    fig, (ax1, ax2) = _cached_subplots('torque_rpm', plt, _make)
+
     for t_idx, table in enumerate(tables):
         rpms, torques, _comps, powers = extract_curve_data(table)
         
-        if rpms:
-            torque_color = TORQUE_COLORS[t_idx % len(TORQUE_COLORS)]
-            power_color = POWER_COLORS[t_idx % len(POWER_COLORS)]
-            
+        if len(rpms):
+            torque_color, power_color = _COLOR_CYCLE[t_idx % len(_COLOR_CYCLE)]
+
             # Plot torque on left axis
             ax1.plot(rpms, torques, marker='o', label=f'Table {t_idx} Torque @ 0x{table.offset:X}', 
                             linewidth=2, markersize=4, color=torque_color)
@@ -105,13 +172,17 @@ def plot_compression_rpm(tables: List[TorqueTable], filename: str = "EDF File"):
         return
 
     plt = _ensure_matplotlib()
-    
-    fig, ax = plt.subplots(figsize=(10, 6))
-    
+
+    def _make():
+        fig, ax = plt.subplots(figsize=(10, 6))
+        return fig, (ax,)
+
+    fig, (ax,) = _cached_subplots('compression_rpm', plt, _make)
+
     for t_idx, table in enumerate(tables):
         rpms, _torques, comps, _powers = extract_curve_data(table)
         
-        if rpms:
+        if len(rpms):
             ax.plot(rpms, comps, marker='o', label=f'Table {t_idx} @ 0x{table.offset:X}', linewidth=2, markersize=4)
     
     ax.set_xlabel('RPM', fontsize=12)
@@ -131,19 +202,20 @@ def plot_both(tables: List[TorqueTable], filename: str = "EDF File"):
         return
 
     plt = _ensure_matplotlib()
-    
-    fig, (ax1, ax3) = plt.subplots(1, 2, figsize=(16, 6))
-    
-    # Create second y-axis for power on left plot
-    ax2 = ax1.twinx()
-    
+
+    def _make():
+        fig, (ax1, ax3) = plt.subplots(1, 2, figsize=(16, 6))
+        # Create second y-axis for power on left plot
+        return fig, (ax1, ax1.twinx(), ax3)
+
+    fig, (ax1, ax2, ax3) = _cached_subplots('both', plt, _make)
+
     for t_idx, table in enumerate(tables):
         rpms, torques, comps, powers = extract_curve_data(table)
         
-        if rpms:
+        if len(rpms):
             label = f'Table {t_idx} @ 0x{table.offset:X}'
-            torque_color = TORQUE_COLORS[t_idx % len(TORQUE_COLORS)]
-            power_color = POWER_COLORS[t_idx % len(POWER_COLORS)]
+            torque_color, power_color = _COLOR_CYCLE[t_idx % len(_COLOR_CYCLE)]
             
             # Left plot: Torque and Power
             ax1.plot(rpms, torques, marker='o', label=f'Table {t_idx} Torque', 
@@ -1,5 +1,7 @@
+import os
 import pytest
 import struct
+from src.core.parser import parse_torque_tables, parse_params
 from src.core.constants import (
     SIG_0RPM, SIG_ROW_I, SIG_ROW_F, SIG_ENDVAR,
     SIG_BOOST_0RPM, SIG_BOOST_ROW,
@@ -7,7 +9,22 @@ from src.core.constants import (
     BOOST0_STRUCT, BOOSTI_STRUCT
 )
 
-@pytest.fixture
+# Real EDF sample used by the round-trip tests (skipped when absent)
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_EDF_FILE = os.path.join(_PROJECT_ROOT, "012d6b90.edf")
+
+@pytest.fixture(scope="session")
+def edf_bytes():
+    """The sample EDF, read from disk once per session.
+
+    Only the immutable bytes are cached; each round-trip test still parses
+    its own mutable copy because the ledger helpers mutate the parsed row
+    objects in place.
+    """
+    with open(_EDF_FILE, 'rb') as f:
+        return f.read()
+
+@pytest.fixture(scope="session")
 def synthetic_torque_data():
     """
     Creates a synthetic binary blob containing one Torque table.
@@ -16,80 +33,112 @@ def synthetic_torque_data():
     - Row I (Int RPM)
     - Row F (Float RPM)
     - EndVar Row
+
+    Session-scoped (the bytes are deterministic and immutable); built by
+    packing into one preallocated buffer instead of an extend chain.
     """
-    data = bytearray()
-    
-    # Padding
-    data.extend(b'\x00' * 10)
-    
-    # 1. 0RPM Row (Offset 10)
-    data.extend(SIG_0RPM)
-    # Struct: Byte, Float(Comp), Float(Torque)
-    # 0, 10.0, 100.0
-    data.extend(ROW0_STRUCT.pack(0, 10.0, 100.0))
-    
-    # 2. Row I (Offset 10 + 7 + 9 = 26)
-    data.extend(SIG_ROW_I)
-    # Struct: Int(RPM), Float(Comp), Float(Torque)
-    # 1000, 10.0, 150.0
-    data.extend(ROWI_STRUCT.pack(1000, 10.0, 150.0))
-    
-    # 3. Row F (Offset 26 + 7 + 12 = 45)
-    data.extend(SIG_ROW_F)
-    # Struct: Float(RPM), Float(Comp), Float(Torque)
-    # 2000.5, 10.0, 200.0
-    data.extend(ROWF_STRUCT.pack(2000.5, 10.0, 200.0))
-    
-    # 4. EndVar (Offset 45 + 7 + 12 = 64)
-    data.extend(SIG_ENDVAR)
-    # Struct: Int(RPM), Float(Comp), Byte
-    # 3000, 10.0, 0
-    data.extend(ENDVAR_STRUCT.pack(3000, 10.0, 0))
-    
+    total = (10 + len(SIG_0RPM) + ROW0_STRUCT.size
+             + len(SIG_ROW_I) + ROWI_STRUCT.size
+             + len(SIG_ROW_F) + ROWF_STRUCT.size
+             + len(SIG_ENDVAR) + ENDVAR_STRUCT.size
+             + 5)
+    buf = bytearray(total)
+    off = 10  # leading padding (zeros)
+
+    # 1. 0RPM Row (Offset 10): Byte, Float(Comp), Float(Torque)
+    buf[off:off + len(SIG_0RPM)] = SIG_0RPM
+    off += len(SIG_0RPM)
+    ROW0_STRUCT.pack_into(buf, off, 0, 10.0, 100.0)
+    off += ROW0_STRUCT.size
+
+    # 2. Row I (Offset 26): Int(RPM), Float(Comp), Float(Torque)
+    buf[off:off + len(SIG_ROW_I)] = SIG_ROW_I
+    off += len(SIG_ROW_I)
+    ROWI_STRUCT.pack_into(buf, off, 1000, 10.0, 150.0)
+    off += ROWI_STRUCT.size
+
+    # 3. Row F (Offset 45): Float(RPM), Float(Comp), Float(Torque)
+    buf[off:off + len(SIG_ROW_F)] = SIG_ROW_F
+    off += len(SIG_ROW_F)
+    ROWF_STRUCT.pack_into(buf, off, 2000.5, 10.0, 200.0)
+    off += ROWF_STRUCT.size
+
+    # 4. EndVar (Offset 64): Int(RPM), Float(Comp), Byte
+    buf[off:off + len(SIG_ENDVAR)] = SIG_ENDVAR
+    off += len(SIG_ENDVAR)
+    ENDVAR_STRUCT.pack_into(buf, off, 3000, 10.0, 0)
+    off += ENDVAR_STRUCT.size
+
     # Trailing bytes
-    data.extend(b'\xFF' * 5)
-    
-    return bytes(data)
+    buf[off:] = b'\xFF' * 5
 
-@pytest.fixture
+    return bytes(buf)
+
+@pytest.fixture(scope="session")
+def parsed_synthetic_torque(synthetic_torque_data):
+    """The synthetic torque blob parsed once per session.
+
+    Returns (bytes, tables). Offsets are position-based, so tests that
+    mutate must take a bytearray copy of the bytes and a deepcopy of the
+    tables; the originals here are shared and must stay untouched.
+    """
+    return synthetic_torque_data, parse_torque_tables(synthetic_torque_data)
+
+@pytest.fixture(scope="session")
 def synthetic_boost_data():
     """
     Creates a synthetic binary blob containing one Boost table.
     """
-    data = bytearray()
-    data.extend(b'\x00' * 20)
-    
-    # 1. Boost 0RPM
-    data.extend(SIG_BOOST_0RPM)
-    # Struct: Byte, 5 floats
-    data.extend(BOOST0_STRUCT.pack(0, 1.0, 1.2, 1.5, 1.8, 2.0))
-    
-    # 2. Boost Row
-    data.extend(SIG_BOOST_ROW)
-    # Struct: Int, 5 floats
-    data.extend(BOOSTI_STRUCT.pack(2000, 1.1, 1.3, 1.6, 1.9, 2.1))
-    
-    return bytes(data)
+    total = (20 + len(SIG_BOOST_0RPM) + BOOST0_STRUCT.size
+             + len(SIG_BOOST_ROW) + BOOSTI_STRUCT.size)
+    buf = bytearray(total)
+    off = 20  # leading padding (zeros)
 
-@pytest.fixture
+    # 1. Boost 0RPM: Byte, 5 floats
+    buf[off:off + len(SIG_BOOST_0RPM)] = SIG_BOOST_0RPM
+    off += len(SIG_BOOST_0RPM)
+    BOOST0_STRUCT.pack_into(buf, off, 0, 1.0, 1.2, 1.5, 1.8, 2.0)
+    off += BOOST0_STRUCT.size
+
+    # 2. Boost Row: Int, 5 floats
+    buf[off:off + len(SIG_BOOST_ROW)] = SIG_BOOST_ROW
+    off += len(SIG_BOOST_ROW)
+    BOOSTI_STRUCT.pack_into(buf, off, 2000, 1.1, 1.3, 1.6, 1.9, 2.1)
+
+    return bytes(buf)
+
+@pytest.fixture(scope="session")
 def synthetic_param_data():
     """
     Creates synthetic parameter data.
     """
-    data = bytearray()
-    
     # EngineInertia (Float) - Signature: 22 46 65 AE 87
     sig_inertia = b'\x22\x46\x65\xAE\x87'
-    data.extend(sig_inertia)
-    data.extend(struct.pack('<f', 0.45))
-    
     # RevLimitSetting (Byte) - Signature: 20 A5 5C C1 C4
     sig_revlim = b'\x20\xA5\x5C\xC1\xC4'
-    data.extend(b'\x00' * 5) # spacing
-    data.extend(sig_revlim)
-    data.extend(struct.pack('B', 1))
-    
-    return bytes(data)
+
+    buf = bytearray(len(sig_inertia) + 4 + 5 + len(sig_revlim) + 1)
+    off = 0
+
+    buf[off:off + len(sig_inertia)] = sig_inertia
+    off += len(sig_inertia)
+    struct.pack_into('<f', buf, off, 0.45)
+    off += 4 + 5  # float payload, then spacing (zeros)
+
+    buf[off:off + len(sig_revlim)] = sig_revlim
+    off += len(sig_revlim)
+    struct.pack_into('B', buf, off, 1)
+
+    return bytes(buf)
+
+@pytest.fixture
+def synthetic_params_by_name(synthetic_param_data):
+    """Name -> Parameter dict over a fresh parse of synthetic_param_data.
+
+    One hash lookup replaces a linear scan per test. Function-scoped on
+    purpose: tests mutate the Parameter objects in place.
+    """
+    return {p.name: p for p in parse_params(synthetic_param_data)}
 
 @pytest.fixture
 def synthetic_multi_table_data():
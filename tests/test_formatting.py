@@ -15,6 +15,13 @@ class TestFormatFloat:
     def test_zero(self):
         assert format_float(0.0, 3) == "0.000"
 
+    def test_signed_zero_not_conflated(self):
+        # ±0.0 hash/compare equal; the result cache must not let one sign's
+        # rendering answer for the other, in either call order
+        assert format_float(0.0, 3) == "0.000"
+        assert format_float(-0.0, 3) == "-0.000"
+        assert format_float(0.0, 3) == "0.000"
+
     def test_large_value_no_scientific(self):
         # 25000.0 must NOT become "2.5e+04"
         result = format_float(25000.0, 1)
@@ -1,4 +1,5 @@
 import pytest
+from operator import attrgetter
 from src.core.parser import (
     find_all, read_by_fmt, 
     parse_torque_tables, parse_boost_tables, parse_params,
@@ -17,6 +18,72 @@ def test_find_all_no_overlap():
     # Should only find index 0, not index 1 (overlap)
     assert res == [0]
 
+def _torque_snapshot(tables):
+    return [(t.offset,
+             [(r.rpm, r.compression, r.torque, r.offset, r.kind, r.exact_signature)
+              for r in t.rows])
+            for t in tables]
+
+def test_parse_torque_tables_paths_agree(monkeypatch, synthetic_torque_data,
+                                         synthetic_multi_table_data,
+                                         synthetic_f309_torque_data,
+                                         synthetic_orphan_rowi_torque_data):
+    """The NumPy run decoders and the scalar fallback loop must parse the
+    same blob to identical rows, whichever path is active."""
+    import src.core.parser as parser
+    from src.core.constants import SIG_0RPM, SIG_ROW_I, SIG_ENDVAR
+    from src.core.constants import ROW0_STRUCT, ROWI_STRUCT, ENDVAR_STRUCT
+    if parser.np is None:
+        pytest.skip("NumPy not installed")
+
+    # Every table shape in the fixture zoo, plus a long row_i run so the
+    # bulk decoder covers more than one record per call
+    long_run = bytearray(SIG_0RPM + ROW0_STRUCT.pack(0, 10.0, 100.0))
+    for i in range(1, 51):
+        long_run += SIG_ROW_I + ROWI_STRUCT.pack(100 * i, 10.0, 100.0 + i)
+    long_run += SIG_ENDVAR + ENDVAR_STRUCT.pack(6000, 10.0, 0)
+
+    blob = (synthetic_torque_data + synthetic_multi_table_data
+            + synthetic_f309_torque_data + synthetic_orphan_rowi_torque_data
+            + bytes(long_run))
+
+    with_np = parse_torque_tables(blob)
+    monkeypatch.setattr(parser, 'np', None)
+    without_np = parse_torque_tables(blob)
+
+    assert _torque_snapshot(with_np) == _torque_snapshot(without_np)
+
+def test_parse_boost_tables_paths_agree(monkeypatch, synthetic_boost_data):
+    import src.core.parser as parser
+    if parser.np is None:
+        pytest.skip("NumPy not installed")
+
+    blob = synthetic_boost_data + b'\x00' * 7 + synthetic_boost_data
+
+    def snapshot(tables):
+        return [(t.offset,
+                 [(r.rpm, r.t0, r.t25, r.t50, r.t75, r.t100, r.offset, r.kind)
+                  for r in t.rows])
+                for t in tables]
+
+    with_np = parse_boost_tables(blob)
+    monkeypatch.setattr(parser, 'np', None)
+    without_np = parse_boost_tables(blob)
+
+    assert snapshot(with_np) == snapshot(without_np)
+
+def test_find_all_window():
+    data = b'\x01\x02\x03\x01\x02\x03\x01\x02\x03'
+    sub = b'\x01\x02\x03'
+    # start skips earlier hits
+    assert list(find_all(data, sub, start=1)) == [3, 6]
+    # a match straddling the window edge is excluded (end is exclusive)
+    assert list(find_all(data, sub, end=8)) == [0, 3]
+    # both bounds together isolate the middle hit
+    assert list(find_all(data, sub, start=3, end=6)) == [3]
+    # end beyond the buffer clamps like bytes.find
+    assert list(find_all(data, sub, end=100)) == [0, 3, 6]
+
 def test_read_by_fmt():
     # Float (4), Int (4), Byte (1)
     # 1.0 = 00 00 80 3F
@@ -100,8 +167,9 @@ def test_parse_params(synthetic_param_data):
     params = parse_params(synthetic_param_data)
     assert len(params) == 2
     
-    # Sort to ensure consistent order
-    params.sort(key=lambda x: x.offset)
+    # Sort to ensure consistent order (attrgetter over a trivial lambda —
+    # the key is dispatched at C level)
+    params.sort(key=attrgetter('offset'))
     
     p1 = params[0]
     assert p1.name == 'EngineInertia'
@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 from unittest.mock import MagicMock, patch
 from src.utils.plotting import plot_torque_rpm, plot_compression_rpm, plot_both
@@ -41,8 +42,9 @@ def test_plot_torque_rpm(mock_ensure, synthetic_torque_data):
     rpms = args[0]
     torques = args[1]
     
-    assert rpms == [0.0, 1000.0, 2000.5]
-    assert torques == [100.0, 150.0, 200.0]
+    # extract_curve_data returns ndarrays when NumPy is installed
+    np.testing.assert_allclose(rpms, [0.0, 1000.0, 2000.5])
+    np.testing.assert_allclose(torques, [100.0, 150.0, 200.0])
     
     # Verify plot called on ax2 (Power)
     call_args_p = mock_ax2.plot.call_args
@@ -70,7 +72,7 @@ def test_plot_compression_rpm(mock_ensure, synthetic_torque_data):
     args = mock_ax.plot.call_args[0]
     comps = args[1]
     # All rows have 10.0 compression
-    assert comps == [10.0, 10.0, 10.0]
+    assert list(comps) == [10.0, 10.0, 10.0]
 
 def test_plot_missing_matplotlib(synthetic_torque_data):
     # Simulate ImportError
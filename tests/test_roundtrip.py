@@ -13,6 +13,7 @@ import json
 import os
 import struct
 import tempfile
+import numpy as np
 import pytest
 from typing import List, Dict, Any
 
@@ -28,6 +29,13 @@ pytestmark = pytest.mark.skipif(
     reason=f"EDF fixture not found: {_EDF_FILE}"
 )
 
+
+def _first_mismatch(data2: bytearray, original: bytes) -> int:
+    """Offset of the first differing byte — one C-level compare + argmax
+    instead of an interpreted per-byte loop over the whole file."""
+    diff = np.frombuffer(bytes(data2), dtype=np.uint8) != np.frombuffer(original, dtype=np.uint8)
+    return int(np.argmax(diff))
+
 # ---------------------------------------------------------------------------
 # Ledger helpers
 # ---------------------------------------------------------------------------
@@ -163,10 +171,8 @@ def _apply_params(data: bytearray, params: List[Parameter],
 class TestRoundTrip:
     """Byte-perfect round-trip using JSON ledger for deterministic reinstatement."""
 
-    def _run_roundtrip(self, parse_fn, record_fn, apply_fn, entity_name):
+    def _run_roundtrip(self, original, parse_fn, record_fn, apply_fn, entity_name):
         """Generic round-trip runner for a single entity type."""
-        with open(_EDF_FILE, 'rb') as f:
-            original = f.read()
 
         # --- Pass 1: mutate and save ---
         data1 = bytearray(original)
@@ -201,35 +207,33 @@ class TestRoundTrip:
                 with open(ledger_path, 'w') as lf:
                     json.dump(ledger, lf, indent=2, default=str)
 
-                for i in range(len(original)):
-                    if data2[i] != original[i]:
-                        pytest.fail(
-                            f"{entity_name} round-trip failed at 0x{i:X}. "
-                            f"Expected 0x{original[i]:02X}, got 0x{data2[i]:02X}. "
-                            f"Ledger saved to {ledger_path}"
-                        )
+                i = _first_mismatch(data2, original)
+                pytest.fail(
+                    f"{entity_name} round-trip failed at 0x{i:X}. "
+                    f"Expected 0x{original[i]:02X}, got 0x{data2[i]:02X}. "
+                    f"Ledger saved to {ledger_path}"
+                )
         finally:
             os.unlink(modified_path)
 
-    def test_torque_round_trip(self):
+    def test_torque_round_trip(self, edf_bytes):
         self._run_roundtrip(
-            parse_torque_tables, _record_torque, _apply_torque, "torque"
+            edf_bytes, parse_torque_tables, _record_torque, _apply_torque, "torque"
         )
 
-    def test_boost_round_trip(self):
+    def test_boost_round_trip(self, edf_bytes):
         self._run_roundtrip(
-            parse_boost_tables, _record_boost, _apply_boost, "boost"
+            edf_bytes, parse_boost_tables, _record_boost, _apply_boost, "boost"
         )
 
-    def test_params_round_trip(self):
+    def test_params_round_trip(self, edf_bytes):
         self._run_roundtrip(
-            parse_params, _record_params, _apply_params, "param"
+            edf_bytes, parse_params, _record_params, _apply_params, "param"
         )
 
-    def test_full_round_trip(self):
+    def test_full_round_trip(self, edf_bytes):
         """ALL entities round-trip together."""
-        with open(_EDF_FILE, 'rb') as f:
-            original = f.read()
+        original = edf_bytes
 
         # --- Pass 1: mutate all and save ---
         data1 = bytearray(original)
@@ -269,12 +273,11 @@ class TestRoundTrip:
                 with open(ledger_path, 'w') as lf:
                     json.dump(all_ledger, lf, indent=2, default=str)
 
-                for i in range(len(original)):
-                    if data2[i] != original[i]:
-                        pytest.fail(
-                            f"Full round-trip failed at 0x{i:X}. "
-                            f"Expected 0x{original[i]:02X}, got 0x{data2[i]:02X}. "
-                            f"Ledger saved to {ledger_path}"
-                        )
+                i = _first_mismatch(data2, original)
+                pytest.fail(
+                    f"Full round-trip failed at 0x{i:X}. "
+                    f"Expected 0x{original[i]:02X}, got 0x{data2[i]:02X}. "
+                    f"Ledger saved to {ledger_path}"
+                )
         finally:
             os.unlink(modified_path)
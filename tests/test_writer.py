@@ -1,59 +1,46 @@
+import copy
+import numpy as np
 import pytest
 import struct
 from src.core.models import TorqueRow, Parameter
-from src.core.writer import write_torque_row, write_param, scale_torque_tables
-from src.core.parser import parse_torque_tables
-from src.core.constants import SIG_0RPM, SIG_ROW_I, ROW0_STRUCT, ROWI_STRUCT
+from src.core.writer import write_torque_row, write_param, scale_torque_tables, scale_boost_tables
+from src.core.parser import parse_torque_tables, parse_boost_tables
+from src.core.constants import (
+    SIG_0RPM, SIG_ROW_I, SIG_ENDVAR,
+    SIG_0RPM_LEN, SIG_ROW_I_LEN, SIG_BOOST_0RPM_LEN, SIG_BOOST_ROW_LEN,
+    ROW0_STRUCT, ROWI_STRUCT, ENDVAR_STRUCT,
+    BOOST0_STRUCT, BOOSTI_STRUCT
+)
 
-def test_write_torque_row_0rpm(synthetic_torque_data):
-    # Create a mutable copy
-    data = bytearray(synthetic_torque_data)
-    
-    # Parse to get the row
-    tables = parse_torque_tables(data)
-    row0 = tables[0].rows[0]
-    assert row0.kind == '0rpm'
-    assert row0.torque == 100.0
-    
-    # Modify row object
-    row0.torque = 123.45
-    
-    # Write back
-    write_torque_row(data, row0)
-    
-    # Verify in binary
-    # 0rpm offset points to Signature. Data is len(SIG) after.
-    # struct is <Bff. Torque is the last float.
-    data_offset = row0.offset + len(SIG_0RPM)
-    # unpack B, f, f
-    _, _, tq = ROW0_STRUCT.unpack_from(data, data_offset)
-    assert tq == pytest.approx(123.45)
-
-def test_write_torque_row_row_i(synthetic_torque_data):
-    data = bytearray(synthetic_torque_data)
-    tables = parse_torque_tables(data)
-    row1 = tables[0].rows[1] # row_i
-    assert row1.kind == 'row_i'
-    assert row1.torque == 150.0
-    
-    row1.torque = 999.99
-    
-    write_torque_row(data, row1)
-    
-    # row_i offset points to Signature.
-    # struct is <iff.
-    _, _, tq = ROWI_STRUCT.unpack_from(data, row1.offset + len(SIG_ROW_I))
-    assert tq == pytest.approx(999.99)
+@pytest.mark.parametrize("kind,struct_,sig_len,initial_tq,new_tq", [
+    ('0rpm',  ROW0_STRUCT, SIG_0RPM_LEN,  100.0, 123.45),   # <Bff
+    ('row_i', ROWI_STRUCT, SIG_ROW_I_LEN, 150.0, 999.99),   # <iff
+])
+def test_write_torque_row(parsed_synthetic_torque, kind, struct_, sig_len, initial_tq, new_tq):
+    # Mutable copies of the session-cached parse (offsets are position
+    # based, so they stay valid against a byte-identical buffer)
+    template, tables_template = parsed_synthetic_torque
+    data = bytearray(template)
+    tables = copy.deepcopy(tables_template)
+    row = next(r for r in tables[0].rows if r.kind == kind)
+    assert row.torque == initial_tq
+
+    # Modify row object and write back
+    row.torque = new_tq
+    write_torque_row(data, row)
+
+    # Verify in binary. The offset points at the signature; the packed
+    # record follows it, with torque as the last field. One memoryview
+    # serves every unpack without re-exporting the buffer.
+    mv = memoryview(data)
+    tq = struct_.unpack_from(mv, row.offset + sig_len)[-1]
+    assert tq == pytest.approx(new_tq)
 
-def test_write_param_float(synthetic_param_data):
+def test_write_param_float(synthetic_param_data, synthetic_params_by_name):
     data = bytearray(synthetic_param_data)
-    # Parse manually or verify logic
-    # EngineInertia is first. float at offset + len(SIG)
-    # Parse to get object
-    from src.core.parser import parse_params
-    params = parse_params(data)
-    # Sort to find EngineInertia
-    p = next(x for x in params if x.name == 'EngineInertia')
+    # EngineInertia is first. float at offset + len(SIG).
+    # O(1) dict lookup from the fixture instead of a linear scan.
+    p = synthetic_params_by_name['EngineInertia']
     
     assert p.values[0] == pytest.approx(0.45)
     
@@ -74,26 +61,74 @@ def test_write_param_float(synthetic_param_data):
     
     # Verify
     # 22 46 65 AE 87 (5 bytes)
-    data_offset = p.offset + 5
+    engine_inertia_sig_len = 5
+    data_offset = p.offset + engine_inertia_sig_len
     val = struct.unpack_from('<f', data, data_offset)[0]
     assert val == pytest.approx(0.99)
 
-def test_scale_torque_tables(synthetic_torque_data):
-    data = bytearray(synthetic_torque_data)
-    tables = parse_torque_tables(data)
-    
+def test_scale_torque_tables(parsed_synthetic_torque):
+    template, tables_template = parsed_synthetic_torque
+    data = bytearray(template)
+    tables = copy.deepcopy(tables_template)
+
     # Scale by +10%
     scale_torque_tables(data, tables, 1.1)
     
-    # Verify values in data
-    # Row 0 (100 -> 110)
+    # Verify values in data with one gather over all torque fields instead
+    # of an unpack_from per row (the offsets are not 4-aligned, so the
+    # float32 payloads are collected byte-wise and reinterpreted).
+    # Row 0 (100 -> 110), Row 1 (150 -> 165)
+    row0, row1 = tables[0].rows[0], tables[0].rows[1]
+    offsets = np.array([row0.offset + SIG_0RPM_LEN + 5,     # skip byte + comp
+                        row1.offset + SIG_ROW_I_LEN + 8],   # skip rpm + comp
+                       dtype=np.intp)
+    payload = np.frombuffer(data, dtype=np.uint8)[offsets[:, None] + np.arange(4)]
+    torques = payload.copy().view('<f4').ravel()
+    np.testing.assert_allclose(torques, [110.0, 165.0], rtol=1e-6)
+
+def test_scale_torque_tables_paths_agree(monkeypatch):
+    """The NumPy scatter path and the scalar write_torque_row fallback of
+    scale_torque_tables must produce byte-identical output; each acts as a
+    reference oracle for the other on a large generated table."""
+    import src.core.writer as writer
+
+    blob = bytearray(b'\x00' * 8)
+    blob += SIG_0RPM + ROW0_STRUCT.pack(0, 10.0, 100.0)
+    for i in range(1, 1001):
+        blob += SIG_ROW_I + ROWI_STRUCT.pack(10 * i, 10.0, 100.0 + i)
+    blob += SIG_ENDVAR + ENDVAR_STRUCT.pack(20000, 10.0, 0)
+    blob = bytes(blob)
+
+    data_np = bytearray(blob)
+    scale_torque_tables(data_np, parse_torque_tables(data_np), 1.37)
+
+    monkeypatch.setattr(writer, 'np', None)
+    data_scalar = bytearray(blob)
+    scale_torque_tables(data_scalar, parse_torque_tables(data_scalar), 1.37)
+
+    assert data_np == data_scalar
+
+def test_scale_boost_tables(synthetic_boost_data):
+    data = bytearray(synthetic_boost_data)
+    tables = parse_boost_tables(data)
+
+    # Scale by +10%
+    scale_boost_tables(data, tables, 1.1)
+
+    # Verify values in data (one memoryview for both unpacks)
+    mv = memoryview(data)
+
+    # 0rpm row (1.0, 1.2, 1.5, 1.8, 2.0) -> *1.1
     row0 = tables[0].rows[0]
-    data_offset0 = row0.offset + len(SIG_0RPM)
-    _, _, tq0 = ROW0_STRUCT.unpack_from(data, data_offset0)
-    assert tq0 == pytest.approx(110.0)
-    
-    # Row 1 (150 -> 165)
+    _, t0, t25, t50, t75, t100 = BOOST0_STRUCT.unpack_from(mv, row0.offset + SIG_BOOST_0RPM_LEN)
+    assert [t0, t25, t50, t75, t100] == pytest.approx([1.1, 1.32, 1.65, 1.98, 2.2])
+
+    # rpm row (1.1, 1.3, 1.6, 1.9, 2.1) -> *1.1, rpm untouched
     row1 = tables[0].rows[1]
-    _, _, tq1 = ROWI_STRUCT.unpack_from(data, row1.offset + len(SIG_ROW_I))
-    assert tq1 == pytest.approx(165.0)
+    rpm, t0, t25, t50, t75, t100 = BOOSTI_STRUCT.unpack_from(mv, row1.offset + SIG_BOOST_ROW_LEN)
+    assert rpm == 2000
+    assert [t0, t25, t50, t75, t100] == pytest.approx([1.21, 1.43, 1.76, 2.09, 2.31])
+
+    # Row objects updated in place too
+    assert row1.t100 == pytest.approx(2.31)
     